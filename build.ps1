@@ -115,7 +115,6 @@ if ($Debug) {
 $PyInstallerArgs += @(
     "--hidden-import=librosa"
     "--hidden-import=soundfile"
-    "--hidden-import=matplotlib"
     "--hidden-import=numpy"
     "--hidden-import=PySide6.QtCore"
     "--hidden-import=PySide6.QtWidgets" 
@@ -1,8 +1,9 @@
 """Main application class with clean separation of concerns."""
 
 import sys
+import logging
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
 from PySide6.QtWidgets import (
     QApplication,
@@ -10,29 +11,86 @@ from PySide6.QtWidgets import (
     QWidget,
     QHBoxLayout,
     QSplitter,
-    QFileDialog,
-    QMessageBox,
-    QDialog,
     QLabel,
 )
-from PySide6.QtCore import Qt, QTimer, QUrl
-from PySide6.QtGui import QAction, QDragEnterEvent, QDropEvent, QIcon, QDesktopServices
+from PySide6.QtCore import Qt, QThreadPool, QTimer, QUrl, Slot
+from PySide6.QtGui import (
+    QAction,
+    QDesktopServices,
+    QDragEnterEvent,
+    QDropEvent,
+    QIcon,
+    QKeySequence,
+    QShortcut,
+)
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 from .core.config import AppConfig, UIStyles
 from .core.music_library import MusicLibrary
-from .core.label_manager import LabelManager
-from .audio import AudioWorker, AudioData
+from .core.label_manager import LabelManager, TrackLabels
+from .audio import AudioProcessor, AudioWorker, AudioData, is_supported_format
 from .ui import LeftPanel, RightPanel
 
+logger = logging.getLogger(__name__)
+
+# Application icon, loaded once and shared by all windows
+_app_icon: Optional[QIcon] = None
+
+
+def get_app_icon() -> Optional[QIcon]:
+    """
+    Get the application icon, loading it on first use.
+
+    Returns:
+        Shared QIcon instance, or None if no icon file is available
+    """
+    global _app_icon
+    if _app_icon is None:
+        icon_path = AppConfig.get_icon_path()
+        if icon_path:
+            _app_icon = QIcon(str(icon_path))
+    return _app_icon
 
 class MuSegApp(QMainWindow):
     """Main application window for the MuSeg Audio Annotation Tool."""
 
+    # Menu bar layout: (menu title, entries). An entry is (text, slot name),
+    # (text, None) for the Open Recent submenu, or None for a separator.
+    _MENU_SPEC = (
+        (
+            "File",
+            (
+                ("New Project...", "_show_new_project_dialog"),
+                ("Open Project...", "_show_open_project_dialog"),
+                ("Open Recent", None),
+                None,
+                ("Open Project Folder...", "_open_project_folder_dialog"),
+            ),
+        ),
+        (
+            "Project",
+            (
+                ("Edit Labels...", "_show_label_editor"),
+                None,
+                ("Add Music Files...", "_show_add_files_dialog"),
+                ("Refresh Library", "_refresh_music_library"),
+            ),
+        ),
+    )
+
+    # Thread pool priority of the selected track's load; prefetches use 0
+    _LOAD_PRIORITY = 1
+
     def __init__(self):
         """Initialize the application."""
         super().__init__()
 
+        # Components created during setup; declared up front so helpers that
+        # run during construction can check for them cheaply
+        self.label_manager: Optional[LabelManager] = None
+        self.right_panel: Optional[RightPanel] = None
+        self.mode_label: Optional[QLabel] = None
+
         # Setup window
         self._setup_window()
 
@@ -47,19 +105,26 @@ class MuSegApp(QMainWindow):
         # Setup UI
         self._setup_ui()
         self._setup_toolbar()
-        self._apply_styling()
 
         # Connect signals
         self._connect_signals()
 
         # Initialize state
         self._current_audio_worker: Optional[AudioWorker] = None
+        self._prefetch_workers: Set[AudioWorker] = set()
         self._current_file_path: Optional[str] = None
-
-        # Setup timers
+        self._url_cache: dict[str, QUrl] = {}  # file_path -> media source URL
+        self._dirty_track_labels: Optional[TrackLabels] = None
+        self._label_defs_version = -1  # config_version last pushed to the UI
+        self._label_display_dirty = False
+        self._latest_position_ms = 0
+        self._last_pushed_position_ms = -1
+
+        # Setup timers and keyboard shortcuts
         self._setup_timers()
+        self._setup_shortcuts()
 
-        # Load initial music library
+        # Load the initial music library of the default project
         self._refresh_music_library()
 
     def _setup_window(self) -> None:
@@ -69,9 +134,9 @@ class MuSegApp(QMainWindow):
         self.setMinimumSize(*AppConfig.MIN_WINDOW_SIZE)
 
         # Set application icon
-        icon_path = AppConfig.get_icon_path()
-        if icon_path:
-            self.setWindowIcon(QIcon(str(icon_path)))
+        icon = get_app_icon()
+        if icon:
+            self.setWindowIcon(icon)
 
         # Enable drag and drop for the main window
         self.setAcceptDrops(True)
@@ -125,50 +190,25 @@ class MuSegApp(QMainWindow):
         # Create menubar for better organization
         menubar = self.menuBar()
 
-        # File menu
-        file_menu = menubar.addMenu("File")
+        for menu_title, entries in self._MENU_SPEC:
+            menu = menubar.addMenu(menu_title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
 
-        # New Project action
-        new_project_action = QAction("New Project...", self)
-        new_project_action.triggered.connect(self._show_new_project_dialog)
-        file_menu.addAction(new_project_action)
+                text, slot_name = entry
+                if slot_name is None:
+                    # Open Recent submenu, filled by _update_recent_projects_menu
+                    self.recent_menu = menu.addMenu(text)
+                    continue
 
-        # Open Project action
-        open_project_action = QAction("Open Project...", self)
-        open_project_action.triggered.connect(self._show_open_project_dialog)
-        file_menu.addAction(open_project_action)
+                action = QAction(text, self)
+                action.triggered.connect(getattr(self, slot_name))
+                menu.addAction(action)
 
-        # Open Recent submenu
-        self.recent_menu = file_menu.addMenu("Open Recent")
         self._update_recent_projects_menu()
 
-        file_menu.addSeparator()
-
-        # Open Project Folder action
-        open_folder_action = QAction("Open Project Folder...", self)
-        open_folder_action.triggered.connect(self._open_project_folder_dialog)
-        file_menu.addAction(open_folder_action)
-
-        # Project menu
-        project_menu = menubar.addMenu("Project")
-
-        # Edit Labels action
-        edit_labels_action = QAction("Edit Labels...", self)
-        edit_labels_action.triggered.connect(self._show_label_editor)
-        project_menu.addAction(edit_labels_action)
-
-        project_menu.addSeparator()
-
-        # Add music action
-        add_action = QAction("Add Music Files...", self)
-        add_action.triggered.connect(self._show_add_files_dialog)
-        project_menu.addAction(add_action)
-
-        # Refresh action
-        refresh_action = QAction("Refresh Library", self)
-        refresh_action.triggered.connect(self._refresh_music_library)
-        project_menu.addAction(refresh_action)
-
         # Status bar for mode indicator
         self.status_bar = self.statusBar()
         self.mode_label = QLabel()
@@ -177,66 +217,92 @@ class MuSegApp(QMainWindow):
 
     def _update_mode_indicator(self):
         """Update the mode indicator in the status bar."""
-        if hasattr(self, "label_manager"):
-            mode = self.label_manager.get_labeling_mode()
-            mode_text = ""
-            project_directory = AppConfig.get_project_directory()
-            if project_directory:
-                mode_text += f"Project: {project_directory.name} | "
-            mode_text += f"Mode: {mode.title()}"
-            if mode == "segmentation":
-                mode_text += " (Connected segments)"
-            else:
-                mode_text += " (Free placement)"
-            self.mode_label.setText(mode_text)
-            self.mode_label.setStyleSheet("color: #888; padding: 2px 8px;")
+        if self.label_manager is None or self.mode_label is None:
+            return
 
-            # Update annotation mode in right panel
-            if hasattr(self, "right_panel"):
-                self.right_panel.set_annotation_mode(mode == "annotation")
+        mode = self.label_manager.get_labeling_mode()
+        mode_text = ""
+        project_directory = AppConfig.get_project_directory()
+        if project_directory:
+            mode_text += f"Project: {project_directory.name} | "
+        mode_text += f"Mode: {mode.title()}"
+        if mode == "segmentation":
+            mode_text += " (Connected segments)"
+        else:
+            mode_text += " (Free placement)"
+        self.mode_label.setText(mode_text)
+        self.mode_label.setStyleSheet("color: #888; padding: 2px 8px;")
 
-    def _apply_styling(self) -> None:
-        """Apply application styling."""
-        self.setStyleSheet(UIStyles.MAIN_STYLESHEET)
+        # Update annotation mode in right panel
+        if self.right_panel is not None:
+            self.right_panel.set_annotation_mode(mode == "annotation")
 
     def _connect_signals(self) -> None:
         """Connect all signal handlers."""
-        # Music library signals
-        self.music_library.library_updated.connect(self._refresh_music_library)
+        # Music library signals (the list is updated per file, not rebuilt)
+        self.music_library.file_added.connect(self.left_panel.add_file)
+        self.music_library.file_added.connect(self._prefetch_waveform)
+        self.music_library.file_removed.connect(self.left_panel.remove_file)
         self.music_library.file_add_failed.connect(self._handle_file_add_error)
 
+        # Label command handlers, keyed by RightPanel.label_command names
+        self._label_commands = {
+            "create": self._create_label_segment,
+            "move_boundary": self._move_label_boundary,
+            "select": self._select_label_segment,
+            "delete": self._delete_label_segment,
+            "move_segment": self._move_label_segment,
+            "end_segment_move": self._end_label_segment_move,
+        }
+
         # Left panel signals
         self.left_panel.add_files_requested.connect(self._show_add_files_dialog)
         self.left_panel.files_dropped.connect(self._handle_dropped_files)
         self.left_panel.track_selected.connect(self._load_track)
         self.left_panel.remove_file_requested.connect(self._remove_file)
 
-        # Right panel signals
+        # Right panel signals; the frequent ones (drags, seeks, volume) are
+        # emitted on the GUI thread, so they are connected directly
+        direct = Qt.ConnectionType.DirectConnection
         self.right_panel.play_pause_requested.connect(self._toggle_playback)
         self.right_panel.stop_requested.connect(self._stop_playback)
-        self.right_panel.volume_changed.connect(self._set_volume)
-        self.right_panel.waveform_position_changed.connect(self._seek_to_position)
-        self.right_panel.label_requested.connect(self._create_label_segment)
-        self.right_panel.label_boundary_moved.connect(self._move_label_boundary)
-        self.right_panel.label_segment_selected.connect(self._select_label_segment)
-        self.right_panel.label_segment_deleted.connect(self._delete_label_segment)
-        self.right_panel.label_segment_moved.connect(self._move_label_segment)
+        self.right_panel.volume_changed.connect(self._set_volume, direct)
+        self.right_panel.waveform_position_changed.connect(
+            self._seek_to_position, direct
+        )
+        self.right_panel.label_command.connect(self._dispatch_label_command, direct)
         self.right_panel.loading_state_changed.connect(self._on_loading_state_changed)
 
         # Media player signals
         self.media_player.positionChanged.connect(self._on_position_changed)
-        self.media_player.durationChanged.connect(self._on_duration_changed)
         self.media_player.playbackStateChanged.connect(self._on_playback_state_changed)
 
     def _setup_timers(self) -> None:
         """Setup application timers."""
-        # Position update timer
+        # Position update timer, only running while playing
         self.position_timer = QTimer()
+        self.position_timer.setInterval(AppConfig.POSITION_UPDATE_INTERVAL_MS)
         self.position_timer.timeout.connect(self._update_position)
-        self.position_timer.start(AppConfig.POSITION_UPDATE_INTERVAL_MS)
 
+        # Label save timer, so a drag gesture writes the labels file only once
+        self._save_debounce_timer = QTimer()
+        self._save_debounce_timer.setSingleShot(True)
+        self._save_debounce_timer.setInterval(AppConfig.LABEL_SAVE_DEBOUNCE_MS)
+        self._save_debounce_timer.timeout.connect(self._flush_label_save)
+
+    def _setup_shortcuts(self) -> None:
+        """Setup window-wide keyboard shortcuts."""
+        # Space toggles play/pause from anywhere in the window; text inputs
+        # still receive their spaces through Qt's shortcut override
+        self.play_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Space), self)
+        self.play_shortcut.setContext(Qt.ShortcutContext.WindowShortcut)
+        self.play_shortcut.activated.connect(self._toggle_playback)
+
+    @Slot()
     def _show_add_files_dialog(self) -> None:
         """Show file dialog to add music files."""
+        from PySide6.QtWidgets import QFileDialog
+
         file_filter = "Audio Files (*.mp3 *.wav);;MP3 Files (*.mp3);;WAV Files (*.wav)"
         files, _ = QFileDialog.getOpenFileNames(
             self, "Add Music Files", "", file_filter
@@ -245,6 +311,7 @@ class MuSegApp(QMainWindow):
         if files:
             self._handle_dropped_files(files)
 
+    @Slot(list)
     def _handle_dropped_files(self, file_paths: list) -> None:
         """
         Handle files dropped onto the application.
@@ -254,6 +321,7 @@ class MuSegApp(QMainWindow):
         """
         self.music_library.add_files(file_paths)
 
+    @Slot(str, str)
     def _handle_file_add_error(self, file_path: str, error_message: str) -> None:
         """
         Handle file addition errors.
@@ -262,16 +330,20 @@ class MuSegApp(QMainWindow):
             file_path: Path to the file that failed
             error_message: Error message
         """
+        from PySide6.QtWidgets import QMessageBox
+
         file_name = Path(file_path).name
         QMessageBox.warning(
             self, "Error Adding File", f"Failed to add {file_name}:\n{error_message}"
         )
 
+    @Slot()
     def _refresh_music_library(self) -> None:
         """Refresh the music library display."""
         audio_files = self.music_library.get_audio_files()
         self.left_panel.refresh_music_list(audio_files)
 
+    @Slot(str)
     def _load_track(self, file_path: str) -> None:
         """
         Load a track for playback and visualization.
@@ -279,6 +351,9 @@ class MuSegApp(QMainWindow):
         Args:
             file_path: Path to the audio file
         """
+        # Persist pending edits of the previous track before switching
+        self._flush_label_save()
+
         self._current_file_path = file_path
         file_name = Path(file_path).name
 
@@ -288,23 +363,69 @@ class MuSegApp(QMainWindow):
         # Stop current playback
         self.media_player.stop()
 
-        # Cancel any running audio worker
-        if self._current_audio_worker and self._current_audio_worker.isRunning():
-            self._current_audio_worker.terminate()
-            self._current_audio_worker.wait()
+        # Cancel any running audio worker without blocking the UI
+        self._cancel_audio_worker()
 
-        # Load audio in background thread
-        self._current_audio_worker = AudioWorker(file_path)
-        self._current_audio_worker.loading_finished.connect(self._on_audio_loaded)
-        self._current_audio_worker.loading_failed.connect(self._on_audio_load_failed)
-        self._current_audio_worker.start()
+        # Load audio on the thread pool, ahead of any queued prefetches
+        worker = AudioWorker(file_path)
+        worker.signals.loading_finished.connect(self._on_audio_loaded)
+        worker.signals.loading_failed.connect(self._on_audio_load_failed)
+        self._current_audio_worker = worker
+        QThreadPool.globalInstance().start(worker, self._LOAD_PRIORITY)
 
         # Set media source
-        self.media_player.setSource(QUrl.fromLocalFile(file_path))
+        url = self._url_cache.get(file_path)
+        if url is None:
+            url = self._url_cache[file_path] = QUrl.fromLocalFile(file_path)
+        self.media_player.setSource(url)
 
         # Initialize labels for this track
         self._init_track_labels(file_path)
 
+    def _cancel_audio_worker(self) -> None:
+        """Ask the current audio worker to stop and let it finish in the background."""
+        worker = self._current_audio_worker
+        self._current_audio_worker = None
+        if worker is None:
+            return
+
+        # Detach so a late result cannot overwrite the newly selected track
+        worker.cancel()
+        worker.signals.loading_finished.disconnect(self._on_audio_loaded)
+        worker.signals.loading_failed.disconnect(self._on_audio_load_failed)
+
+    @Slot(str)
+    def _prefetch_waveform(self, file_path: str) -> None:
+        """
+        Build the cached waveform envelope of a newly added file in the background.
+
+        Args:
+            file_path: Path of the added library file
+        """
+        if AudioProcessor.has_cached_envelope(file_path):
+            return
+
+        # Keep the worker alive on the Python side so closeEvent can cancel it
+        worker = AudioWorker(file_path)
+        worker.setAutoDelete(False)
+        worker.signals.loading_finished.connect(
+            lambda _audio_data, w=worker: self._prefetch_workers.discard(w)
+        )
+        worker.signals.loading_failed.connect(
+            lambda _path, _error, w=worker: self._prefetch_workers.discard(w)
+        )
+        self._prefetch_workers.add(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    def _cancel_prefetch_workers(self) -> None:
+        """Drop queued waveform prefetches and stop the running ones."""
+        # Workers stay referenced until they finish, as the pool does not own them
+        pool = QThreadPool.globalInstance()
+        for worker in self._prefetch_workers:
+            worker.cancel()
+            pool.tryTake(worker)
+
+    @Slot(AudioData)
     def _on_audio_loaded(self, audio_data: AudioData) -> None:
         """
         Handle successful audio loading.
@@ -312,6 +433,13 @@ class MuSegApp(QMainWindow):
         Args:
             audio_data: Loaded audio data
         """
+        # A queued result can still arrive after its worker was detached
+        if (
+            self._current_file_path is None
+            or audio_data.file_path != Path(self._current_file_path)
+        ):
+            return
+
         success = self.right_panel.load_audio_data(audio_data)
         if success:
             self.right_panel.set_track_loaded(audio_data.file_name)
@@ -320,6 +448,7 @@ class MuSegApp(QMainWindow):
         else:
             self.right_panel.set_track_error("Failed to display waveform")
 
+    @Slot(str, str)
     def _on_audio_load_failed(self, file_path: str, error_message: str) -> None:
         """
         Handle audio loading failure.
@@ -328,8 +457,12 @@ class MuSegApp(QMainWindow):
             file_path: Path to the file that failed
             error_message: Error message
         """
+        if file_path != self._current_file_path:
+            return
+
         self.right_panel.set_track_error(error_message)
 
+    @Slot()
     def _toggle_playback(self) -> None:
         """Toggle between play and pause."""
         if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
@@ -337,10 +470,12 @@ class MuSegApp(QMainWindow):
         else:
             self.media_player.play()
 
+    @Slot()
     def _stop_playback(self) -> None:
         """Stop playback."""
         self.media_player.stop()
 
+    @Slot(float)
     def _set_volume(self, volume: float) -> None:
         """
         Set audio volume.
@@ -350,6 +485,7 @@ class MuSegApp(QMainWindow):
         """
         self.audio_output.setVolume(volume)
 
+    @Slot(float)
     def _seek_to_position(self, position_seconds: float) -> None:
         """
         Seek to a specific position in the track.
@@ -360,24 +496,24 @@ class MuSegApp(QMainWindow):
         position_ms = int(position_seconds * 1000)
         self.media_player.setPosition(position_ms)
 
+    @Slot(int)
     def _on_position_changed(self, position_ms: int) -> None:
         """
         Handle position changes from media player.
 
-        Args:
-            position_ms: Current position in milliseconds
-        """
-        self.right_panel.set_position(position_ms)
-
-    def _on_duration_changed(self, duration_ms: int) -> None:
-        """
-        Handle duration changes from media player.
+        While playing, the value is only recorded here and the position timer
+        forwards it to the UI so that bursts of ticks collapse into a single
+        repaint. Otherwise (seeking while paused or stopped) it is pushed
+        immediately.
 
         Args:
-            duration_ms: Duration in milliseconds
+            position_ms: Current position in milliseconds
         """
-        self.right_panel.set_duration(duration_ms)
+        self._latest_position_ms = position_ms
+        if not self.position_timer.isActive():
+            self._update_position()
 
+    @Slot(QMediaPlayer.PlaybackState)
     def _on_playback_state_changed(self, state: QMediaPlayer.PlaybackState) -> None:
         """
         Handle playback state changes.
@@ -387,6 +523,13 @@ class MuSegApp(QMainWindow):
         """
         self.right_panel.set_playback_state(state)
 
+        if state == QMediaPlayer.PlaybackState.PlayingState:
+            self.position_timer.start()
+        else:
+            self.position_timer.stop()
+            self._update_position()
+
+    @Slot(bool)
     def _on_loading_state_changed(self, is_loading: bool) -> None:
         """
         Handle waveform loading state changes to enable/disable track list.
@@ -396,17 +539,25 @@ class MuSegApp(QMainWindow):
         """
         self.left_panel.set_loading_state(is_loading)
 
+    @Slot()
     def _update_position(self) -> None:
-        """Update position display (called by timer)."""
-        # This is handled by media player signals, but kept for future use
-        pass
+        """Push the latest player position to the UI (called by timer)."""
+        position_ms = self._latest_position_ms
+        if position_ms == self._last_pushed_position_ms:
+            return
+
+        self._last_pushed_position_ms = position_ms
+        self.right_panel.set_position(position_ms)
 
     def closeEvent(self, event) -> None:
         """Handle application close event."""
-        # Stop any running audio worker
-        if self._current_audio_worker and self._current_audio_worker.isRunning():
-            self._current_audio_worker.terminate()
-            self._current_audio_worker.wait()
+        # Persist any pending label edits
+        self._flush_label_save()
+
+        # Stop any running audio workers, waiting only briefly for them
+        self._cancel_audio_worker()
+        self._cancel_prefetch_workers()
+        QThreadPool.globalInstance().waitForDone(200)
 
         # Stop media player
         self.media_player.stop()
@@ -421,8 +572,7 @@ class MuSegApp(QMainWindow):
         track_labels = self.label_manager.load_track_labels(file_path)
 
         # Set up label definitions in UI
-        label_definitions = self.label_manager.get_label_definitions()
-        self.right_panel.set_label_definitions(label_definitions)
+        self._sync_label_definitions()
 
         # Set current segments
         segments = track_labels.get_segments()
@@ -431,15 +581,33 @@ class MuSegApp(QMainWindow):
         # Connect track labels signals
         track_labels.labels_changed.connect(self._on_labels_changed)
 
+    @Slot()
     def _on_labels_changed(self) -> None:
         """Handle changes to track labels."""
         # Update label definitions in UI (colors, names, etc.)
-        label_definitions = self.label_manager.get_label_definitions()
-        self.right_panel.set_label_definitions(label_definitions)
+        self._sync_label_definitions()
 
         # Update the display
         self._update_label_display()
 
+    def _sync_label_definitions(self) -> None:
+        """Push label definitions to the right panel if they changed since last push."""
+        version = self.label_manager.config_version
+        if version == self._label_defs_version:
+            return
+
+        self._label_defs_version = version
+        label_definitions = self.label_manager.get_label_definitions()
+        self.right_panel.set_label_definitions(label_definitions)
+
+    @Slot(str, object)
+    def _dispatch_label_command(self, command: str, args: tuple) -> None:
+        """Route a label command from the right panel to its handler."""
+        handler = self._label_commands.get(command)
+        if handler is not None:
+            handler(*args)
+
+    @Slot(str, float)
     def _create_label_segment(self, label_id: str, end_position: float) -> None:
         """Create a new label segment."""
         track_labels = self.label_manager.get_current_track_labels()
@@ -458,7 +626,7 @@ class MuSegApp(QMainWindow):
             start_position = current_position
             # Default to 5 seconds duration, or until end of track
             duration = 5.0
-            audio_duration = getattr(self.right_panel.waveform_widget, "duration", 0)
+            audio_duration = self.right_panel.waveform_widget.duration
             if audio_duration > 0:
                 end_position = min(start_position + duration, audio_duration)
             else:
@@ -466,7 +634,9 @@ class MuSegApp(QMainWindow):
 
         # Ensure we have a valid segment
         if end_position <= start_position:
-            print(f"Invalid segment: end ({end_position}) <= start ({start_position})")
+            logger.debug(
+                "Invalid segment: end (%s) <= start (%s)", end_position, start_position
+            )
             return
 
         # Add the segment with the current labeling mode
@@ -474,10 +644,14 @@ class MuSegApp(QMainWindow):
             label_id, start_position, end_position, labeling_mode
         )
         if not success:
-            print(
-                f"Failed to add segment: {label_id} from {start_position} to {end_position}"
+            logger.debug(
+                "Failed to add segment: %s from %s to %s",
+                label_id,
+                start_position,
+                end_position,
             )
 
+    @Slot(int, str, float)
     def _move_label_boundary(
         self, segment_index: int, boundary_type: str, new_time: float
     ) -> None:
@@ -486,8 +660,7 @@ class MuSegApp(QMainWindow):
         if not track_labels:
             return
 
-        segments = track_labels.get_segments()
-        if not (0 <= segment_index < len(segments)):
+        if not (0 <= segment_index < track_labels.segment_count()):
             return
 
         # Get the current labeling mode
@@ -495,11 +668,11 @@ class MuSegApp(QMainWindow):
 
         if boundary_type == "start":
             self._move_start_boundary(
-                track_labels, segments, segment_index, new_time, labeling_mode
+                track_labels, segment_index, new_time, labeling_mode
             )
         elif boundary_type == "end":
             self._move_end_boundary(
-                track_labels, segments, segment_index, new_time, labeling_mode
+                track_labels, segment_index, new_time, labeling_mode
             )
 
         # Update the label bar display
@@ -507,107 +680,109 @@ class MuSegApp(QMainWindow):
 
     def _move_start_boundary(
         self,
-        track_labels,
-        segments,
+        track_labels: TrackLabels,
         segment_index: int,
         new_time: float,
         labeling_mode: str,
     ) -> None:
         """Move the start boundary of a segment."""
-        segment = segments[segment_index]
+        starts = track_labels.starts_array
+        end_seconds = float(track_labels.ends_array[segment_index])
 
         if labeling_mode == "segmentation":
             # Segmentation mode: maintain connections, no overlaps
-            min_time = (
-                segments[segment_index - 1].start_seconds if segment_index > 0 else 0.0
-            )
-            max_time = (
-                segment.end_seconds - 1.0
-            )  # Leave at least 1 second for the segment
+            prev_start = float(starts[segment_index - 1]) if segment_index > 0 else 0.0
+            min_time = prev_start
+            max_time = end_seconds - 1.0  # Leave at least 1 second for the segment
             new_time = max(min_time, min(max_time, new_time))
 
             # Update current segment's start (use unchecked method for connected segments)
             track_labels.update_segment_unchecked(
-                segment_index, new_time, segment.end_seconds
+                segment_index, new_time, end_seconds, save=False
             )
 
             # Update previous segment's end to maintain connection
             if segment_index > 0:
-                prev_segment = segments[segment_index - 1]
                 track_labels.update_segment_unchecked(
-                    segment_index - 1, prev_segment.start_seconds, new_time
+                    segment_index - 1, prev_start, new_time, save=False
                 )
         else:
             # Annotation mode: free movement, overlaps allowed
-            max_time = (
-                segment.end_seconds - 0.1
-            )  # Leave at least 0.1 second for the segment
+            max_time = end_seconds - 0.1  # Leave at least 0.1 second for the segment
             new_time = max(0.0, min(max_time, new_time))
 
             # Simply update the segment's start time
             track_labels.update_segment_unchecked(
-                segment_index, new_time, segment.end_seconds
+                segment_index, new_time, end_seconds, save=False
             )
 
-        # Save changes
-        track_labels._save_labels()
+        # Save once the drag settles
+        self._schedule_label_save(track_labels)
 
     def _move_end_boundary(
         self,
-        track_labels,
-        segments,
+        track_labels: TrackLabels,
         segment_index: int,
         new_time: float,
         labeling_mode: str,
     ) -> None:
         """Move the end boundary of a segment."""
-        segment = segments[segment_index]
+        ends = track_labels.ends_array
+        start_seconds = float(track_labels.starts_array[segment_index])
+        has_next = segment_index < len(ends) - 1
 
         if labeling_mode == "segmentation":
             # Segmentation mode: maintain connections, no overlaps
-            min_time = (
-                segment.start_seconds + 1.0
-            )  # Leave at least 1 second for the segment
-            max_time = (
-                segments[segment_index + 1].end_seconds
-                if segment_index < len(segments) - 1
-                else float("inf")
-            )
+            next_end = float(ends[segment_index + 1]) if has_next else float("inf")
+            min_time = start_seconds + 1.0  # Leave at least 1 second for the segment
+            max_time = next_end
             new_time = max(min_time, min(max_time, new_time))
 
             # Update current segment's end (use unchecked method for connected segments)
             track_labels.update_segment_unchecked(
-                segment_index, segment.start_seconds, new_time
+                segment_index, start_seconds, new_time, save=False
             )
 
             # Update next segment's start to maintain connection
-            if segment_index < len(segments) - 1:
-                next_segment = segments[segment_index + 1]
+            if has_next:
                 track_labels.update_segment_unchecked(
-                    segment_index + 1, new_time, next_segment.end_seconds
+                    segment_index + 1, new_time, next_end, save=False
                 )
         else:
             # Annotation mode: free movement, overlaps allowed
             # Get audio duration to clamp the end time
-            audio_duration = getattr(
-                self.right_panel.waveform_widget, "duration", float("inf")
-            )
-            min_time = (
-                segment.start_seconds + 0.1
-            )  # Leave at least 0.1 second for the segment
+            audio_duration = self.right_panel.waveform_widget.duration or float("inf")
+            min_time = start_seconds + 0.1  # Leave at least 0.1 second for the segment
             max_time = audio_duration
             new_time = max(min_time, min(max_time, new_time))
 
             # Simply update the segment's end time
             track_labels.update_segment_unchecked(
-                segment_index, segment.start_seconds, new_time
+                segment_index, start_seconds, new_time, save=False
             )
 
-        # Save changes
-        track_labels._save_labels()
+        # Save once the drag settles
+        self._schedule_label_save(track_labels)
+
+    def _schedule_label_save(self, track_labels: TrackLabels) -> None:
+        """Mark track labels as modified and (re)start the save timer."""
+        self._dirty_track_labels = track_labels
+        self._save_debounce_timer.start()
 
+    @Slot()
+    def _flush_label_save(self) -> None:
+        """Write pending label changes to disk immediately."""
+        self._save_debounce_timer.stop()
+        track_labels = self._dirty_track_labels
+        self._dirty_track_labels = None
+        if track_labels is not None:
+            track_labels._save_labels()
+
+    @Slot(int)
     def _select_label_segment(self, segment_index: int) -> None:
         """Handle label segment selection."""
+        self._flush_label_save()
+
         track_labels = self.label_manager.get_current_track_labels()
         if not track_labels:
             return
@@ -619,10 +794,14 @@ class MuSegApp(QMainWindow):
             self.right_panel.set_selected_label_segment(segment_index)
             # Seek to the start of the selected segment
             self._seek_to_position(segment.start_seconds)
-            print(
-                f"Selected segment: {segment.label_id} ({segment.start_seconds:.2f}s - {segment.end_seconds:.2f}s)"
+            logger.debug(
+                "Selected segment: %s (%.2fs - %.2fs)",
+                segment.label_id,
+                segment.start_seconds,
+                segment.end_seconds,
             )
 
+    @Slot(int)
     def _delete_label_segment(self, segment_index: int) -> None:
         """Delete a label segment."""
         track_labels = self.label_manager.get_current_track_labels()
@@ -634,16 +813,20 @@ class MuSegApp(QMainWindow):
             segment = segments[segment_index]
             success = track_labels.remove_segment(segment_index)
             if success:
-                print(
-                    f"Deleted segment: {segment.label_id} ({segment.start_seconds:.2f}s - {segment.end_seconds:.2f}s)"
+                logger.debug(
+                    "Deleted segment: %s (%.2fs - %.2fs)",
+                    segment.label_id,
+                    segment.start_seconds,
+                    segment.end_seconds,
                 )
                 # Update the label bar display
                 self._update_label_display()
                 # Clear selection
                 self.right_panel.clear_label_selection()
             else:
-                print(f"Failed to delete segment {segment_index}")
+                logger.debug("Failed to delete segment %d", segment_index)
 
+    @Slot(int, float, float)
     def _move_label_segment(
         self, segment_index: int, new_start_time: float, new_end_time: float
     ) -> None:
@@ -652,8 +835,8 @@ class MuSegApp(QMainWindow):
         if not track_labels:
             return
 
-        segments = track_labels.get_segments()
-        if not (0 <= segment_index < len(segments)):
+        segment = track_labels.get_segment(segment_index)
+        if segment is None:
             return
 
         # Only allow segment moving in annotation mode
@@ -661,25 +844,63 @@ class MuSegApp(QMainWindow):
         if labeling_mode != "annotation":
             return
 
-        # Get the segment to move
-        segment = segments[segment_index]
-
-        # Update segment times
-        segment.start_seconds = new_start_time
-        segment.end_seconds = new_end_time
+        # Update segment times (index stays stable for the rest of the drag)
+        track_labels.move_segment(
+            segment_index, new_start_time, new_end_time, save=False
+        )
 
-        # Save the changes
-        track_labels._save_labels()
+        # Save once the drag settles
+        self._schedule_label_save(track_labels)
 
         # Update the display
         self._update_label_display()
 
-        print(
-            f"Moved segment {segment_index}: {segment.label_id} to {new_start_time:.2f}s - {new_end_time:.2f}s"
+        logger.debug(
+            "Moved segment %d: %s to %.2fs - %.2fs",
+            segment_index,
+            segment.label_id,
+            new_start_time,
+            new_end_time,
         )
 
+    @Slot(int)
+    def _end_label_segment_move(self, segment_index: int) -> None:
+        """Restore the segment order once a segment drag ends."""
+        track_labels = self.label_manager.get_current_track_labels()
+        if not track_labels:
+            return
+
+        segment = track_labels.get_segment(segment_index)
+        if not track_labels.sort_segments():
+            return
+
+        # Indices changed: save, redraw and keep the moved segment selected
+        self._flush_label_save()
+        self._update_label_display()
+        new_index = next(
+            i for i, s in enumerate(track_labels.get_segments()) if s is segment
+        )
+        self.right_panel.set_selected_label_segment(new_index)
+
     def _update_label_display(self) -> None:
-        """Update the label display in the right panel."""
+        """
+        Schedule an update of the label display in the right panel.
+
+        The update runs on the next event loop iteration, so a burst of label
+        changes (e.g. moving two connected boundaries) results in one repaint.
+        """
+        if self._label_display_dirty:
+            return
+        self._label_display_dirty = True
+        QTimer.singleShot(0, self._flush_label_display)
+
+    @Slot()
+    def _flush_label_display(self) -> None:
+        """Update the label display in the right panel if an update is pending."""
+        if not self._label_display_dirty:
+            return
+        self._label_display_dirty = False
+
         track_labels = self.label_manager.get_current_track_labels()
         if not track_labels:
             return
@@ -740,13 +961,17 @@ class MuSegApp(QMainWindow):
             # Update the recent projects menu to remove invalid projects
             self._update_recent_projects_menu()
 
+    @Slot()
     def _clear_recent_projects(self) -> None:
         """Clear all recent projects."""
         AppConfig.save_recent_projects([])
         self._update_recent_projects_menu()
 
+    @Slot()
     def _show_new_project_dialog(self) -> None:
         """Show dialog to create a new project."""
+        from PySide6.QtWidgets import QFileDialog
+
         project_dir = QFileDialog.getExistingDirectory(
             self, "Select Folder for New Project", "", QFileDialog.Option.ShowDirsOnly
         )
@@ -754,8 +979,11 @@ class MuSegApp(QMainWindow):
         if project_dir:
             self._create_new_project(Path(project_dir))
 
+    @Slot()
     def _show_open_project_dialog(self) -> None:
         """Show dialog to open an existing project by selecting musegproject.json."""
+        from PySide6.QtWidgets import QFileDialog, QMessageBox
+
         project_dir = AppConfig.get_project_directory()
         project_dir = str(project_dir.parent) if project_dir else str(Path.cwd())
         config_file, _ = QFileDialog.getOpenFileName(
@@ -779,6 +1007,8 @@ class MuSegApp(QMainWindow):
 
     def _create_new_project(self, project_dir: Path) -> None:
         """Create a new project with all necessary folders and files."""
+        from PySide6.QtWidgets import QMessageBox
+
         try:
             # Create project structure
             music_dir = project_dir / "music"
@@ -810,28 +1040,26 @@ class MuSegApp(QMainWindow):
                 self, "Error Creating Project", f"Failed to create project:\n{str(e)}"
             )
 
+    @Slot()
     def _open_project_folder_dialog(self) -> None:
         """Show dialog to open the project folder."""
         if AppConfig._current_project_dir:
             project_dir = AppConfig._current_project_dir
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(project_dir)))
 
+    @Slot()
     def _show_label_editor(self) -> None:
         """Show the label editor dialog."""
+        from PySide6.QtWidgets import QDialog, QMessageBox
+
         if AppConfig._current_project_dir:
             from .ui.label_editor import LabelEditor
 
             editor = LabelEditor(self.label_manager, self)
             editor.labels_changed.connect(self._on_labels_changed)
             if editor.exec() == QDialog.DialogCode.Accepted:
-                # Reload label definitions in the label manager
-                self.label_manager.label_config._load_config()
-
-                # Update the right panel with new label definitions
-                label_definitions = self.label_manager.get_label_definitions()
-                self.right_panel.set_label_definitions(label_definitions)
-
-                # Update the mode indicator
+                # The editor's single labels_changed already pushed the new
+                # definitions, which it saved from memory, so nothing to reload
                 self._update_mode_indicator()
         else:
             QMessageBox.warning(
@@ -840,6 +1068,9 @@ class MuSegApp(QMainWindow):
 
     def _set_project_directory(self, project_dir: Path) -> None:
         """Set the project directory and update all components."""
+        # Persist pending edits before leaving the current project
+        self._flush_label_save()
+
         # Update configuration
         AppConfig.set_project_directory(project_dir)
 
@@ -853,8 +1084,7 @@ class MuSegApp(QMainWindow):
         self.label_manager.set_project_directory(project_dir)
 
         # Set label definitions in the right panel
-        label_definitions = self.label_manager.get_label_definitions()
-        self.right_panel.set_label_definitions(label_definitions)
+        self._sync_label_definitions()
 
         # Update mode indicator
         self._update_mode_indicator()
@@ -869,6 +1099,7 @@ class MuSegApp(QMainWindow):
         # Update recent projects menu
         self._update_recent_projects_menu()
 
+    @Slot(str)
     def _remove_file(self, file_path: str) -> None:
         """Remove a file from the library and its associated labels."""
         from PySide6.QtWidgets import QMessageBox
@@ -885,21 +1116,20 @@ class MuSegApp(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            # Stop media player completely and clear any file references
-            self.media_player.stop()
-            self.media_player.setSource(QUrl())  # Clear the source
+            # Write pending edits now so a late save cannot recreate removed labels
+            self._flush_label_save()
 
-            # Stop playback and clear current state if this is the current file
+            # Stop playback and clear current state if this is the current file;
+            # other files are not held open by the media player
             if self._current_file_path == file_path:
-                self._stop_playback()
+                self.media_player.stop()
+                self.media_player.setSource(QUrl())  # Release the file handle
                 self.right_panel.reset()
                 self._current_file_path = None
-                if self._current_audio_worker:
-                    self._current_audio_worker = None
+                self._cancel_audio_worker()
+            self._url_cache.pop(file_path, None)
 
             # Small delay to ensure file handles are released
-            from PySide6.QtCore import QTimer
-
             QTimer.singleShot(
                 100, lambda: self._perform_file_removal(file_path, file_name)
             )
@@ -910,11 +1140,11 @@ class MuSegApp(QMainWindow):
 
         # Remove labels first
         labels_removed = self.label_manager.remove_track_labels(file_path)
-        print(f"Labels removed: {labels_removed}")
+        logger.debug("Labels removed for %s: %s", file_path, labels_removed)
 
         # Remove the music file
         file_removed = self.music_library.remove_file(file_path)
-        print(f"File removed: {file_removed}")
+        logger.debug("File removed %s: %s", file_path, file_removed)
 
         if file_removed:
             QMessageBox.information(
@@ -931,17 +1161,10 @@ class MuSegApp(QMainWindow):
         """Handle drag enter events for the main window."""
         if event.mimeData().hasUrls():
             # Check if any of the dragged files are supported audio files
-            from .audio.processor import AudioProcessor
-
-            processor = AudioProcessor()
-
-            supported_files = []
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if processor.is_supported_format(file_path):
-                    supported_files.append(file_path)
-
-            if supported_files:
+            if any(
+                is_supported_format(url.toLocalFile())
+                for url in event.mimeData().urls()
+            ):
                 event.acceptProposedAction()
             else:
                 event.ignore()
@@ -950,15 +1173,11 @@ class MuSegApp(QMainWindow):
 
     def dropEvent(self, event: QDropEvent) -> None:
         """Handle drop events for the main window."""
-        from .audio.processor import AudioProcessor
-
-        processor = AudioProcessor()
-
-        supported_files = []
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if processor.is_supported_format(file_path):
-                supported_files.append(file_path)
+        supported_files = [
+            file_path
+            for file_path in (url.toLocalFile() for url in event.mimeData().urls())
+            if is_supported_format(file_path)
+        ]
 
         if supported_files:
             self._handle_dropped_files(supported_files)
@@ -966,16 +1185,6 @@ class MuSegApp(QMainWindow):
         else:
             event.ignore()
 
-    def keyPressEvent(self, event) -> None:
-        """Handle global keyboard events."""
-        if event.key() == Qt.Key.Key_Space:
-            # Space key always toggles play/pause
-            self._toggle_playback()
-            event.accept()
-        else:
-            # Let other widgets handle their own key events
-            super().keyPressEvent(event)
-
 
 def create_app() -> QApplication:
     """
@@ -986,6 +1195,7 @@ def create_app() -> QApplication:
     """
     app = QApplication(sys.argv)
     app.setStyle("Fusion")  # Use modern style
+    app.setStyleSheet(UIStyles.APP_STYLESHEET)
 
     # Set application metadata
     app.setApplicationName(AppConfig.APP_NAME)
@@ -993,15 +1203,17 @@ def create_app() -> QApplication:
     app.setOrganizationName(AppConfig.ORGANIZATION_NAME)
 
     # Set global application icon
-    icon_path = AppConfig.get_icon_path()
-    if icon_path:
-        app.setWindowIcon(QIcon(str(icon_path)))
+    icon = get_app_icon()
+    if icon:
+        app.setWindowIcon(icon)
 
     return app
 
 
 def main() -> None:
     """Main application entry point."""
+    logging.basicConfig(level=logging.WARNING)
+
     app = create_app()
 
     # Create and show main window
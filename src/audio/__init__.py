@@ -1,5 +1,12 @@
 """Audio module __init__."""
 
-from .processor import AudioData, AudioProcessor, AudioWorker
+__all__ = ["AudioData", "AudioProcessor", "AudioWorker", "is_supported_format"]
 
-__all__ = ["AudioData", "AudioProcessor", "AudioWorker"]
+
+def __getattr__(name):
+    # Load the processor module on first attribute access
+    if name in __all__:
+        from . import processor
+
+        return getattr(processor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,45 +1,170 @@
 """Audio processing and management module."""
 
-import librosa
+import os
+import logging
+import threading
 import numpy as np
+from collections import OrderedDict
 from pathlib import Path
-from typing import Tuple, Optional
-from PySide6.QtCore import QThread, Signal
+from typing import Callable, List, Tuple, Optional
+from PySide6.QtCore import QObject, QRunnable, Signal
 
 from ..core.config import AppConfig
 
+logger = logging.getLogger(__name__)
+
+# Highest display resolution in min/max bins
+_DISPLAY_BINS = AppConfig.MAX_WAVEFORM_POINTS // 2
+# Coarsest envelope pyramid level kept, in bins; narrower plots reduce from it
+_PYRAMID_MIN_BINS = 256
+# Display widths whose prepared arrays are kept per track
+_DISPLAY_CACHE_SIZE = 4
+
+# Recently loaded tracks by envelope cache path, most recently used last, so
+# reselecting a track skips reading its cache entry; shared by pool threads
+_recent_audio: "OrderedDict[Path, AudioData]" = OrderedDict()
+_recent_audio_lock = threading.Lock()
+
+
+class _LoadCancelled(Exception):
+    """Raised inside a load whose result is no longer wanted."""
+
+
+def _block_envelope(y: np.ndarray, bin_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a block of samples to per-bin minima and maxima.
+
+    Args:
+        y: Mono signal samples
+        bin_samples: Number of samples per bin; a trailing partial bin is kept
+
+    Returns:
+        Tuple of (bin_minima, bin_maxima)
+    """
+    n_full = len(y) // bin_samples
+    split = n_full * bin_samples
+    bins = y[:split].reshape(n_full, bin_samples)
+    env_min = bins.min(axis=1)
+    env_max = bins.max(axis=1)
+
+    if split < len(y):
+        tail = y[split:]
+        env_min = np.append(env_min, tail.min())
+        env_max = np.append(env_max, tail.max())
+
+    return env_min, env_max
+
+
+def _reduce_envelope(
+    env_min: np.ndarray, env_max: np.ndarray, n_bins: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge envelope bins down to a coarser resolution.
+
+    Args:
+        env_min: Per-bin minima
+        env_max: Per-bin maxima
+        n_bins: Number of output bins; must not exceed the input length
+
+    Returns:
+        Tuple of (bin_minima, bin_maxima) with n_bins entries each
+    """
+    group = len(env_min) // n_bins
+    split = n_bins * group
+    out_min = env_min[:split].reshape(n_bins, group).min(axis=1)
+    out_max = env_max[:split].reshape(n_bins, group).max(axis=1)
+
+    # Fold leftover bins into the last output bin instead of dropping them
+    if split < len(env_min):
+        out_min[-1] = min(out_min[-1], env_min[split:].min())
+        out_max[-1] = max(out_max[-1], env_max[split:].max())
+
+    return out_min, out_max
+
+
+def _envelope_pyramid(
+    env_min: np.ndarray, env_max: np.ndarray
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Build successively halved copies of an envelope, finest first.
+
+    Args:
+        env_min: Per-bin minima
+        env_max: Per-bin maxima
+
+    Returns:
+        List of (bin_minima, bin_maxima) levels, starting with the input and
+        ending before a level would drop under _PYRAMID_MIN_BINS bins
+    """
+    levels = [(env_min, env_max)]
+    while len(env_min) // 2 >= _PYRAMID_MIN_BINS:
+        env_min, env_max = _reduce_envelope(env_min, env_max, len(env_min) // 2)
+        levels.append((env_min, env_max))
+    return levels
+
+
+def is_supported_format(file_path: str) -> bool:
+    """
+    Check if the file format is supported.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        True if format is supported
+    """
+    return os.path.splitext(file_path)[1].lower() in AppConfig.SUPPORTED_AUDIO_FORMATS
+
 
 class AudioData:
     """Container for audio data and metadata."""
 
     def __init__(self, file_path: str):
         self.file_path = Path(file_path)
-        self.waveform: Optional[np.ndarray] = None
+        self._file_name = os.path.basename(file_path)
+        self._display_name = os.path.splitext(self._file_name)[0]
+        self.envelope_min: Optional[np.ndarray] = None
+        self.envelope_max: Optional[np.ndarray] = None
+        # Envelope halved again and again, finest first, so any display width
+        # is reduced from a level close to it instead of from the full envelope
+        self.envelope_levels: List[Tuple[np.ndarray, np.ndarray]] = []
         self.sample_rate: Optional[float] = None
         self.duration: float = 0.0
         self.loaded: bool = False
+        # Display arrays by bin count, most recently used last; filled and
+        # trimmed to _DISPLAY_CACHE_SIZE by prepare_waveform_for_display
+        self.display_cache: "OrderedDict[int, Tuple[np.ndarray, np.ndarray]]" = (
+            OrderedDict()
+        )
 
     @property
     def file_name(self) -> str:
         """Get the filename without path."""
-        return self.file_path.name
+        return self._file_name
 
     @property
     def display_name(self) -> str:
         """Get a display-friendly name."""
-        return self.file_path.stem
+        return self._display_name
 
 
 class AudioProcessor:
     """Handles audio file loading and processing."""
 
     @staticmethod
-    def load_audio(file_path: str) -> AudioData:
+    def load_audio(
+        file_path: str, is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> AudioData:
         """
         Load audio file and return AudioData object.
 
+        Only the min/max envelope of the signal is kept; playback streams the
+        file through the media player, so the raw samples are never needed.
+
         Args:
             file_path: Path to the audio file
+            is_cancelled: Polled while decoding; returning True abandons the
+                load with _LoadCancelled
 
         Returns:
             AudioData object with loaded audio information
@@ -50,48 +175,300 @@ class AudioProcessor:
         audio_data = AudioData(file_path)
 
         try:
-            # Load audio file with librosa
-            y, sr = librosa.load(file_path, sr=None)
+            cache_path = AudioProcessor._get_cache_path(file_path)
+            with _recent_audio_lock:
+                recent = _recent_audio.get(cache_path)
+                # Identical copies share a cache entry but not their AudioData
+                if recent is not None and recent.file_path == audio_data.file_path:
+                    _recent_audio.move_to_end(cache_path)
+                    return recent
+
+            cached = AudioProcessor._load_cached_envelope(cache_path)
+            if cached is not None:
+                env_min, env_max, sr, duration = cached
+            else:
+                try:
+                    env_min, env_max, frames, sr = AudioProcessor._stream_envelope(
+                        file_path, is_cancelled
+                    )
+                except _LoadCancelled:
+                    raise
+                except Exception:
+                    env_min, env_max, frames, sr = AudioProcessor._decode_envelope(
+                        file_path
+                    )
+                duration = frames / sr
+                AudioProcessor._store_cached_envelope(
+                    cache_path, env_min, env_max, sr, duration
+                )
 
-            audio_data.waveform = y
+            # Keep the envelope float32 and contiguous whatever its source
+            audio_data.envelope_min = np.ascontiguousarray(env_min, dtype=np.float32)
+            audio_data.envelope_max = np.ascontiguousarray(env_max, dtype=np.float32)
+            audio_data.envelope_levels = _envelope_pyramid(
+                audio_data.envelope_min, audio_data.envelope_max
+            )
             audio_data.sample_rate = sr
-            audio_data.duration = len(y) / sr
+            audio_data.duration = duration
             audio_data.loaded = True
 
+            with _recent_audio_lock:
+                _recent_audio[cache_path] = audio_data
+                while len(_recent_audio) > AppConfig.RECENT_AUDIO_CACHE_SIZE:
+                    _recent_audio.popitem(last=False)
+
             return audio_data
 
+        except _LoadCancelled:
+            raise
         except Exception as e:
             raise Exception(f"Failed to load audio file: {str(e)}")
 
+    @staticmethod
+    def _get_cache_path(file_path: str) -> Path:
+        """
+        Get the envelope cache file for an audio file.
+
+        The key is the file's size and modification time, so an edited file
+        misses the cache without hashing its contents.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            Path of the .npz cache entry
+        """
+        st = os.stat(file_path)
+        key = f"{st.st_size}_{st.st_mtime_ns}"
+        return AppConfig.get_cache_directory() / f"{Path(file_path).stem}_{key}.npz"
+
+    @staticmethod
+    def has_cached_envelope(file_path: str) -> bool:
+        """
+        Check whether the envelope of an audio file is already cached.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            True if a cache entry for the current file contents exists
+        """
+        try:
+            return AudioProcessor._get_cache_path(file_path).exists()
+        except OSError:
+            return False
+
+    @staticmethod
+    def _load_cached_envelope(
+        cache_path: Path,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, float, float]]:
+        """
+        Load a cached envelope.
+
+        Args:
+            cache_path: Path of the cache entry
+
+        Returns:
+            Tuple of (envelope_min, envelope_max, sample_rate, duration), or
+            None if there is no usable entry
+        """
+        if not cache_path.exists():
+            return None
+
+        try:
+            with np.load(cache_path) as data:
+                cached = (
+                    data["env_min"],
+                    data["env_max"],
+                    float(data["sr"]),
+                    float(data["duration"]),
+                )
+            # Refresh the timestamp so eviction drops least recently used first
+            os.utime(cache_path)
+            return cached
+        except Exception as e:
+            logger.debug("Ignoring unreadable envelope cache %s: %s", cache_path, e)
+            return None
+
+    @staticmethod
+    def _store_cached_envelope(
+        cache_path: Path,
+        env_min: np.ndarray,
+        env_max: np.ndarray,
+        sr: float,
+        duration: float,
+    ) -> None:
+        """
+        Write an envelope to the cache and evict old entries over the size cap.
+
+        Args:
+            cache_path: Path of the cache entry
+            env_min: Per-bin minima
+            env_max: Per-bin maxima
+            sr: Sample rate
+            duration: Duration in seconds
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write to a per-thread temporary file first so readers never see a
+            # partial entry, even when two workers build the same envelope
+            tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(
+                    f, env_min=env_min, env_max=env_max, sr=sr, duration=duration
+                )
+            os.replace(tmp_path, cache_path)
+
+            AudioProcessor._evict_cache(cache_path.parent)
+        except OSError as e:
+            logger.debug("Could not write envelope cache %s: %s", cache_path, e)
+
+    @staticmethod
+    def _evict_cache(cache_dir: Path) -> None:
+        """
+        Remove least recently used cache entries until under MAX_CACHE_BYTES.
+
+        Args:
+            cache_dir: Directory holding the cache entries
+        """
+        entries = []
+        total = 0
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith(".npz"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+
+        if total <= AppConfig.MAX_CACHE_BYTES:
+            return
+
+        for _, size, path in sorted(entries):
+            os.remove(path)
+            total -= size
+            if total <= AppConfig.MAX_CACHE_BYTES:
+                break
+
+    @staticmethod
+    def _stream_envelope(
+        file_path: str, is_cancelled: Optional[Callable[[], bool]] = None
+    ) -> Tuple[np.ndarray, np.ndarray, int, float]:
+        """
+        Build the envelope block by block through libsndfile.
+
+        Args:
+            file_path: Path to the audio file
+            is_cancelled: Checked before each block; True raises _LoadCancelled
+
+        Returns:
+            Tuple of (envelope_min, envelope_max, frame_count, sample_rate)
+        """
+        import soundfile
+
+        bin_samples = AppConfig.ENVELOPE_BIN_SAMPLES
+        mins: List[np.ndarray] = []
+        maxs: List[np.ndarray] = []
+        frames = 0
+
+        # Blocks are a multiple of the bin size, so bins never straddle blocks
+        with soundfile.SoundFile(file_path) as f:
+            sr = f.samplerate
+            for block in f.blocks(
+                blocksize=AppConfig.AUDIO_BLOCK_FRAMES,
+                dtype="float32",
+                always_2d=False,
+            ):
+                if is_cancelled is not None and is_cancelled():
+                    raise _LoadCancelled(file_path)
+
+                # Mix multichannel audio down to mono
+                if block.ndim == 2:
+                    block = block.mean(axis=1, dtype=np.float32)
+                block_min, block_max = _block_envelope(block, bin_samples)
+                mins.append(block_min)
+                maxs.append(block_max)
+                frames += len(block)
+
+        if frames == 0:
+            raise ValueError("Audio file contains no samples")
+
+        return np.concatenate(mins), np.concatenate(maxs), frames, sr
+
+    @staticmethod
+    def _decode_envelope(
+        file_path: str,
+    ) -> Tuple[np.ndarray, np.ndarray, int, float]:
+        """
+        Build the envelope from a full librosa decode.
+
+        Used for files libsndfile cannot read; librosa is imported lazily so
+        the common path never pays for it.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            Tuple of (envelope_min, envelope_max, frame_count, sample_rate)
+        """
+        import librosa
+
+        y, sr = librosa.load(file_path, sr=None)
+        # Some resampling backends hand back float64; match the streaming path
+        y = np.ascontiguousarray(y, dtype=np.float32)
+        env_min, env_max = _block_envelope(y, AppConfig.ENVELOPE_BIN_SAMPLES)
+        return env_min, env_max, len(y), sr
+
     @staticmethod
     def prepare_waveform_for_display(
-        audio_data: AudioData,
+        audio_data: AudioData, max_bins: int = _DISPLAY_BINS
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Prepare waveform data for display by downsampling if necessary.
 
+        Pass the plot width in device pixels as max_bins: one min/max pair per
+        pixel column shows every peak while drawing no more points than fit.
+
         Args:
             audio_data: AudioData object with loaded audio
+            max_bins: Largest number of min/max bins to return, capped at
+                MAX_WAVEFORM_POINTS / 2
 
         Returns:
-            Tuple of (time_axis, amplitude_data) for plotting
+            Tuple of (time_axis, amplitude_data) for plotting, float32, with
+            interleaved minima and maxima
         """
-        if not audio_data.loaded or audio_data.waveform is None:
+        if not audio_data.loaded or audio_data.envelope_min is None:
             raise ValueError("Audio data not loaded")
 
-        y = audio_data.waveform
-        duration = audio_data.duration
+        n_bins = min(max(int(max_bins), 1), _DISPLAY_BINS, len(audio_data.envelope_min))
+        display_cache = audio_data.display_cache
+        cached = display_cache.get(n_bins)
+        if cached is not None:
+            display_cache.move_to_end(n_bins)
+            return cached
+
+        # Start from the coarsest pyramid level that still has enough bins
+        env_min = audio_data.envelope_min
+        env_max = audio_data.envelope_max
+        for level_min, level_max in audio_data.envelope_levels:
+            if len(level_min) < n_bins:
+                break
+            env_min, env_max = level_min, level_max
 
-        # Downsample for display if too many samples
-        max_points = AppConfig.MAX_WAVEFORM_POINTS
-        if len(y) > max_points:
-            step = len(y) // max_points
-            y_display = y[::step]
-            time_display = np.linspace(0, duration, len(y_display))
-        else:
-            y_display = y
-            time_display = np.linspace(0, duration, len(y))
+        # Merge bins down for display if too many; keeping the min and max of
+        # each bin lets peaks survive instead of aliasing like plain striding
+        if len(env_min) > n_bins:
+            env_min, env_max = _reduce_envelope(env_min, env_max, n_bins)
+        time_display = np.linspace(0, audio_data.duration, 2 * n_bins, dtype=np.float32)
 
+        # Interleave minima and maxima so the plotted line sweeps each bin
+        y_display = np.empty(2 * n_bins, dtype=np.float32)
+        y_display[0::2] = env_min
+        y_display[1::2] = env_max
+
+        display_cache[n_bins] = (time_display, y_display)
+        while len(display_cache) > _DISPLAY_CACHE_SIZE:
+            display_cache.popitem(last=False)
         return time_display, y_display
 
     @staticmethod
@@ -105,28 +482,48 @@ class AudioProcessor:
         Returns:
             True if format is supported
         """
-        path = Path(file_path)
-        return path.suffix.lower() in AppConfig.SUPPORTED_AUDIO_FORMATS
+        return is_supported_format(file_path)
 
 
-class AudioWorker(QThread):
-    """Worker thread for loading audio files without blocking the UI."""
+class AudioWorkerSignals(QObject):
+    """Signals emitted by AudioWorker from pool threads."""
 
-    # Signals
     loading_started = Signal(str)  # file_path
     loading_finished = Signal(AudioData)  # audio_data
     loading_failed = Signal(str, str)  # file_path, error_message
 
+
+class AudioWorker(QRunnable):
+    """Loads an audio file on a QThreadPool thread without blocking the UI."""
+
     def __init__(self, file_path: str):
         super().__init__()
         self.file_path = file_path
+        self.signals = AudioWorkerSignals()
         self._processor = AudioProcessor()
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """Stop this load at the next block and drop its result."""
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """Check whether cancel() was called."""
+        return self._cancelled
 
     def run(self):
-        """Run the audio loading in background thread."""
+        """Run the audio loading in a pool thread."""
+        # Skip loads cancelled while still queued in the pool
+        if self._cancelled:
+            return
+
         try:
-            self.loading_started.emit(self.file_path)
-            audio_data = self._processor.load_audio(self.file_path)
-            self.loading_finished.emit(audio_data)
+            self.signals.loading_started.emit(self.file_path)
+            audio_data = self._processor.load_audio(self.file_path, self.is_cancelled)
+            # Drop the result if a newer track was requested meanwhile
+            if self._cancelled:
+                return
+            self.signals.loading_finished.emit(audio_data)
         except Exception as e:
-            self.loading_failed.emit(self.file_path, str(e))
+            if not self._cancelled:
+                self.signals.loading_failed.emit(self.file_path, str(e))
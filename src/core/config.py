@@ -1,9 +1,69 @@
 """Configuration constants for the Music Segment Labeler application."""
 
+import os
 import sys
 import json
+import time
+import functools
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
+
+# Label configuration written to new projects, serialized once at import
+_DEFAULT_LABEL_CONFIG = {
+    "labeling_mode": "segmentation",  # "segmentation" or "annotation"
+    "label_definitions": (
+        {
+            "id": "intro",
+            "name": "Intro",
+            "color": "#FF6B6B",
+            "hotkey": "1",
+            "description": "Track introduction",
+        },
+        {
+            "id": "main",
+            "name": "Main",
+            "color": "#4ECDC4",
+            "hotkey": "2",
+            "description": "Main section/theme",
+        },
+        {
+            "id": "buildup",
+            "name": "Buildup",
+            "color": "#45B7D1",
+            "hotkey": "3",
+            "description": "Energy building section",
+        },
+        {
+            "id": "mini_break",
+            "name": "Mini Break",
+            "color": "#96CEB4",
+            "hotkey": "4",
+            "description": "Breakdown/calm section",
+        },
+        {
+            "id": "drop",
+            "name": "Drop",
+            "color": "#459448",
+            "hotkey": "5",
+            "description": "Energy release/climax",
+        },
+        {
+            "id": "breakdown",
+            "name": "Breakdown",
+            "color": "#6867A0",
+            "hotkey": "6",
+            "description": "Breakdown/calm section",
+        },
+        {
+            "id": "outro",
+            "name": "Outro",
+            "color": "#DDA0DD",
+            "hotkey": "7",
+            "description": "Track ending",
+        },
+    ),
+}
+_DEFAULT_LABEL_CONFIG_BYTES = json.dumps(_DEFAULT_LABEL_CONFIG, indent=2).encode()
 
 
 class AppConfig:
@@ -19,25 +79,53 @@ class AppConfig:
     MIN_WINDOW_SIZE = (800, 600)
 
     # Audio settings
-    SUPPORTED_AUDIO_FORMATS = [".mp3", ".wav"]
+    SUPPORTED_AUDIO_FORMATS = frozenset({".mp3", ".wav"})
     MAX_WAVEFORM_POINTS = 10000
-    POSITION_UPDATE_INTERVAL_MS = 100
+    AUDIO_BLOCK_FRAMES = 1 << 20  # Frames decoded per streaming read
+    ENVELOPE_BIN_SAMPLES = 256  # Samples folded into one min/max envelope bin
+    MAX_CACHE_BYTES = 256 * 1024 * 1024  # Size cap for cached waveform envelopes
+    RECENT_AUDIO_CACHE_SIZE = 16  # Loaded tracks kept in memory for reselection
+    POSITION_UPDATE_INTERVAL_MS = 33  # ~30 Hz UI refresh for the playhead
+    LABEL_SAVE_DEBOUNCE_MS = 250  # Delay before persisting dragged labels
+    LABEL_EDIT_DEBOUNCE_MS = 120  # Delay before typed label edits update the list
+    DRAG_UPDATE_INTERVAL_MS = 16  # ~60 Hz forwarding of boundary drags
+    WAVEFORM_RESIZE_DEBOUNCE_MS = 30  # Pause in resizing before re-rendering
 
     # UI settings
     LEFT_PANEL_WIDTH = 300
     WAVEFORM_HEIGHT = 300
+    # Horizontal margins of the waveform plot; the label bar uses the same
+    # margins so that its segments line up with the waveform times
+    PLOT_LEFT_MARGIN = 20
+    PLOT_RIGHT_MARGIN = 18
     CONTROLS_HEIGHT = 120
 
     # Recent projects settings
     MAX_RECENT_PROJECTS = 10
+    RECENT_PROJECT_VERIFY_SECONDS = 60  # How long an existence check stays valid
+
+    # Recent project path -> time.monotonic() of its last existence check
+    _verified_projects: Dict[str, float] = {}
 
     # Current project directory
     _current_project_dir: Optional[Path] = None
 
+    # Resolved project paths, refreshed by set_project_directory; until a
+    # project is set they point next to the application checkout
+    _fallback_dir = Path(__file__).parent.parent.parent.parent
+    _music_dir = _fallback_dir / "music"
+    _labels_dir = _fallback_dir / "labels"
+    _label_config_file = _fallback_dir / "musegproject.json"
+    _cache_dir = _fallback_dir / ".museg_cache"
+
     @classmethod
     def set_project_directory(cls, project_dir: Path) -> None:
         """Set the current project directory."""
         cls._current_project_dir = project_dir
+        cls._music_dir = project_dir / "music"
+        cls._labels_dir = project_dir / "labels"
+        cls._label_config_file = project_dir / "musegproject.json"
+        cls._cache_dir = project_dir / ".museg_cache"
 
         # Create necessary subdirectories
         music_dir = cls.get_music_directory()
@@ -59,8 +147,9 @@ class AppConfig:
         """Get the current project directory."""
         return cls._current_project_dir
 
-    @classmethod
-    def get_recent_projects_file(cls) -> Path:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def get_recent_projects_file() -> Path:
         """Get the path to the recent projects file."""
         # Store in user's home directory or app data directory
         if sys.platform == "win32":
@@ -82,12 +171,23 @@ class AppConfig:
             with open(recent_file, "r") as f:
                 data = json.load(f)
 
-            # Convert strings to Path objects and filter out non-existent projects
+            # Convert strings to Path objects and filter out non-existent projects;
+            # entries checked within the last minute are trusted without a stat
+            now = time.monotonic()
             recent_projects = []
             for project_path in data.get("recent_projects", []):
                 path = Path(project_path)
-                if path.exists() and (path / "musegproject.json").exists():
+                verified_at = cls._verified_projects.get(project_path)
+                if (
+                    verified_at is not None
+                    and now - verified_at < cls.RECENT_PROJECT_VERIFY_SECONDS
+                ):
+                    recent_projects.append(path)
+                elif (path / "musegproject.json").exists():
+                    cls._verified_projects[project_path] = now
                     recent_projects.append(path)
+                else:
+                    cls._verified_projects.pop(project_path, None)
 
             return recent_projects[: cls.MAX_RECENT_PROJECTS]
         except (json.JSONDecodeError, IOError):
@@ -103,9 +203,16 @@ class AppConfig:
             projects_data = {
                 "recent_projects": [str(p) for p in projects[: cls.MAX_RECENT_PROJECTS]]
             }
+            payload = json.dumps(projects_data, indent=2).encode()
+
+            # Skip the write when the list did not change
+            if recent_file.exists() and recent_file.read_bytes() == payload:
+                return
 
-            with open(recent_file, "w") as f:
-                json.dump(projects_data, f, indent=2)
+            # Write a temporary file and swap it in so a crash cannot corrupt the list
+            tmp_file = recent_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, recent_file)
         except IOError:
             # Silently fail if we can't write the file
             pass
@@ -127,89 +234,34 @@ class AppConfig:
     @staticmethod
     def _create_default_label_config(config_file: Path) -> None:
         """Create a default label configuration file."""
-        default_config = {
-            "labeling_mode": "segmentation",  # "segmentation" or "annotation"
-            "label_definitions": [
-                {
-                    "id": "intro",
-                    "name": "Intro",
-                    "color": "#FF6B6B",
-                    "hotkey": "1",
-                    "description": "Track introduction",
-                },
-                {
-                    "id": "main",
-                    "name": "Main",
-                    "color": "#4ECDC4",
-                    "hotkey": "2",
-                    "description": "Main section/theme",
-                },
-                {
-                    "id": "buildup",
-                    "name": "Buildup",
-                    "color": "#45B7D1",
-                    "hotkey": "3",
-                    "description": "Energy building section",
-                },
-                {
-                    "id": "mini_break",
-                    "name": "Mini Break",
-                    "color": "#96CEB4",
-                    "hotkey": "4",
-                    "description": "Breakdown/calm section",
-                },
-                {
-                    "id": "drop",
-                    "name": "Drop",
-                    "color": "#459448",
-                    "hotkey": "5",
-                    "description": "Energy release/climax",
-                },
-                {
-                    "id": "breakdown",
-                    "name": "Breakdown",
-                    "color": "#6867A0",
-                    "hotkey": "6",
-                    "description": "Breakdown/calm section",
-                },
-                {
-                    "id": "outro",
-                    "name": "Outro",
-                    "color": "#DDA0DD",
-                    "hotkey": "7",
-                    "description": "Track ending",
-                },
-            ],
-        }
-
-        with open(config_file, "w") as f:
-            json.dump(default_config, f, indent=2)
+        config_file.write_bytes(_DEFAULT_LABEL_CONFIG_BYTES)
 
     # File paths
     @classmethod
     def get_music_directory(cls) -> Path:
         """Get the music directory path."""
-        if cls._current_project_dir:
-            return cls._current_project_dir / "music"
-        return Path(__file__).parent.parent.parent.parent / "music"
+        return cls._music_dir
 
     @classmethod
     def get_labels_directory(cls) -> Path:
         """Get the labels directory path."""
-        if cls._current_project_dir:
-            return cls._current_project_dir / "labels"
-        return Path(__file__).parent.parent.parent.parent / "labels"
+        return cls._labels_dir
 
     @classmethod
     def get_label_config_file(cls) -> Path:
         """Get the label configuration file path."""
-        if cls._current_project_dir:
-            return cls._current_project_dir / "musegproject.json"
-        return Path(__file__).parent.parent.parent.parent / "musegproject.json"
+        return cls._label_config_file
+
+    @classmethod
+    def get_cache_directory(cls) -> Path:
+        """Get the waveform cache directory path."""
+        return cls._cache_dir
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_icon_path() -> Optional[Path]:
         """Get the path to the application icon, handling both dev and bundled environments."""
+        # The location cannot change while running, so the lookup is cached
         # Check if running as PyInstaller bundle
         if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
             # PyInstaller bundle - try to find bundled icon first
@@ -304,8 +356,11 @@ class UIStyles:
         }}
     """
 
+    # Object name of the library list, which LIST_WIDGET_STYLESHEET targets
+    MUSIC_LIST_NAME = "musicList"
+
     LIST_WIDGET_STYLESHEET = f"""
-        QListWidget {{
+        QListView#{MUSIC_LIST_NAME} {{
             background-color: {UIColors.PANEL_BACKGROUND};
             border: 1px solid #555;
             border-radius: 8px;
@@ -313,19 +368,22 @@ class UIStyles:
             color: {UIColors.TEXT_PRIMARY};
             font-size: 12px;
         }}
-        QListWidget::item {{
+        QListView#{MUSIC_LIST_NAME}::item {{
             padding: 8px;
             border-radius: 4px;
             margin: 2px;
         }}
-        QListWidget::item:selected {{
+        QListView#{MUSIC_LIST_NAME}::item:selected {{
             background-color: {UIColors.PRIMARY};
         }}
-        QListWidget::item:hover {{
+        QListView#{MUSIC_LIST_NAME}::item:hover {{
             background-color: #555;
         }}
     """
 
+    # Installed once on the QApplication; widgets pick it up via the cascade
+    APP_STYLESHEET = MAIN_STYLESHEET + LIST_WIDGET_STYLESHEET
+
     PLAY_BUTTON_STYLESHEET = """
         QPushButton {
             font-size: 18px;
@@ -1,10 +1,97 @@
 """Label management and configuration system."""
 
+import os
 import json
+import mmap
+import bisect
+import operator
+import logging
+import functools
+import itertools
+import threading
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+from collections import Counter
 from dataclasses import dataclass
-from PySide6.QtCore import QObject, Signal
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+logger = logging.getLogger(__name__)
+
+# Prefer orjson for label file I/O when it is installed; both paths read and
+# write UTF-8 bytes with two-space indentation
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+    def _loads(data: Any) -> Any:
+        return json.loads(bytes(data))
+
+
+# Files smaller than this are read outright; mapping them costs more than it saves
+_MMAP_MIN_BYTES = 4096
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, mapping it into memory instead of copying when large."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return _loads(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return _loads(view)
+            finally:
+                view.release()
+
+
+@functools.lru_cache(maxsize=64)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a JSON file once per modification time and size.
+
+    The result is shared between callers and must not be modified.
+
+    Args:
+        path_str: Path of the JSON file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+
+    Returns:
+        Parsed JSON data
+    """
+    return _read_json(Path(path_str))
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, reusing the previous result if it has not changed."""
+    st = os.stat(path)
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _write_json(path: Path, payload: bytes) -> None:
+    """Write serialized JSON to a file."""
+    # Write a temporary file and swap it in so a crash cannot leave a torn file
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+def _track_id_for(track_file_path: str) -> str:
+    """Get the labels file ID of a track: its 5-digit prefix, or else its stem."""
+    track_filename = Path(track_file_path).name
+    if track_filename.startswith(("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")):
+        return track_filename[:5]
+    return Path(track_file_path).stem
 
 
 @dataclass
@@ -17,7 +104,7 @@ class LabelDefinition:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelSegment:
     """A labeled segment in a track."""
 
@@ -30,26 +117,64 @@ class LabelSegment:
         return self.end_seconds - self.start_seconds
 
 
+# Shared key functions for sorting and serializing segments
+_start_of = operator.attrgetter("start_seconds")
+_label_id_of = operator.attrgetter("label_id")
+
+# Shared across LabelConfig instances so a version is never reused after a
+# project switch replaces the config object
+_config_versions = itertools.count()
+
+
+class _ConfigWriteTask(QRunnable):
+    """Writes a serialized label configuration on a QThreadPool thread."""
+
+    def __init__(self, config: "LabelConfig", payload: bytes, sequence: int):
+        super().__init__()
+        self._config = config
+        self._payload = payload
+        self._sequence = sequence
+
+    def run(self) -> None:
+        """Write the configuration, logging instead of raising on failure."""
+        try:
+            self._config._write_payload(self._payload, self._sequence)
+        except OSError as e:
+            logger.warning("Error saving label config: %s", e)
+
+
 class LabelConfig:
     """Manages label configuration from JSON file."""
 
     def __init__(self, config_path: Path):
         self.config_path = config_path
         self._label_definitions: Dict[str, LabelDefinition] = {}
+        self._hotkeys: Dict[str, str] = {}  # hotkey -> label id
+        self._name_to_id: Dict[str, str] = {}  # label name -> label id
+        self._definitions_view: Tuple[LabelDefinition, ...] = ()
         self._labeling_mode: str = "segmentation"  # Default mode
+        self.version: int = next(_config_versions)
+
+        # Saves are numbered when requested; a background write that lands
+        # after a newer save is dropped instead of overwriting it
+        self._write_lock = threading.Lock()
+        self._save_sequence = itertools.count(1)
+        self._written_sequence = 0
+
         self._load_config()
 
     def _load_config(self) -> None:
         """Load label configuration from JSON file."""
+        self.version = next(_config_versions)
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+            config_data = _load_json(self.config_path)
 
             # Load labeling mode
             self._labeling_mode = config_data.get("labeling_mode", "segmentation")
 
             self._label_definitions.clear()
-            for label_data in config_data.get("label_definitions", []):
+            self._hotkeys.clear()
+            for i, label_data in enumerate(config_data.get("label_definitions", [])):
                 label_def = LabelDefinition(
                     id=label_data["id"],
                     name=label_data["name"],
@@ -57,9 +182,11 @@ class LabelConfig:
                     description=label_data.get("description", ""),
                 )
                 self._label_definitions[label_def.id] = label_def
+                self._hotkeys[label_data.get("hotkey") or str(i + 1)] = label_def.id
+            self._index_definitions()
 
         except Exception as e:
-            print(f"Error loading label config: {e}")
+            logger.warning("Error loading label config: %s", e)
             # Fallback to default labels
             self._create_default_labels()
 
@@ -80,15 +207,49 @@ class LabelConfig:
         ]
 
         self._label_definitions = {label.id: label for label in default_labels}
+        self._assign_hotkeys()
+        self._index_definitions()
+
+    def _index_definitions(self) -> None:
+        """Rebuild the lookups derived from the label definitions."""
+        self._definitions_view = tuple(self._label_definitions.values())
+        self._name_to_id = {
+            label_def.name: label_def.id
+            for label_def in self._label_definitions.values()
+        }
 
-    def get_label_definitions(self) -> List[LabelDefinition]:
-        """Get all available label definitions."""
-        return list(self._label_definitions.values())
+    def _assign_hotkeys(self) -> None:
+        """Number the hotkeys by definition order, as _save_config writes them."""
+        self._hotkeys = {
+            str(i + 1): label_id for i, label_id in enumerate(self._label_definitions)
+        }
+
+    def get_label_definitions(self) -> Tuple[LabelDefinition, ...]:
+        """Get all available label definitions (shared; do not modify)."""
+        return self._definitions_view
 
     def get_label_definition(self, label_id: str) -> Optional[LabelDefinition]:
         """Get a specific label definition by ID."""
         return self._label_definitions.get(label_id)
 
+    def get_label_definition_by_hotkey(self, hotkey: str) -> Optional[LabelDefinition]:
+        """Get the label definition bound to a hotkey."""
+        label_id = self._hotkeys.get(hotkey)
+        return self._label_definitions.get(label_id) if label_id else None
+
+    def resolve_label_id(self, name_or_id: str) -> Optional[str]:
+        """Get the ID of the label with the given ID or name, if defined."""
+        if name_or_id in self._label_definitions:
+            return name_or_id
+        return self._name_to_id.get(name_or_id)
+
+    def set_label_definitions(self, definitions: List[LabelDefinition]) -> None:
+        """Replace all label definitions (not saved until _save_config)."""
+        self._label_definitions = {label_def.id: label_def for label_def in definitions}
+        self._assign_hotkeys()
+        self._index_definitions()
+        self.version = next(_config_versions)
+
     def get_labeling_mode(self) -> str:
         """Get the current labeling mode."""
         return self._labeling_mode
@@ -101,8 +262,8 @@ class LabelConfig:
         self._labeling_mode = mode
         self._save_config()
 
-    def _save_config(self) -> None:
-        """Save the current configuration to file."""
+    def _config_payload(self) -> bytes:
+        """Serialize the current configuration."""
         config_data = {
             "labeling_mode": self._labeling_mode,
             "label_definitions": [
@@ -116,9 +277,25 @@ class LabelConfig:
                 for i, label_def in enumerate(self._label_definitions.values())
             ],
         }
+        return _dumps(config_data)
 
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(config_data, f, indent=2)
+    def _write_payload(self, payload: bytes, sequence: int) -> None:
+        """Write a serialized configuration unless a newer save already landed."""
+        with self._write_lock:
+            if sequence < self._written_sequence:
+                return
+            _write_json(self.config_path, payload)
+            self._written_sequence = sequence
+
+    def _save_config(self) -> None:
+        """Save the current configuration to file."""
+        self._write_payload(self._config_payload(), next(self._save_sequence))
+
+    def save_config_in_background(self) -> None:
+        """Save the current configuration to file on a QThreadPool thread."""
+        # Serialize now so later edits on the GUI thread cannot race the write
+        task = _ConfigWriteTask(self, self._config_payload(), next(self._save_sequence))
+        QThreadPool.globalInstance().start(task)
 
 
 class TrackLabels(QObject):
@@ -130,33 +307,99 @@ class TrackLabels(QObject):
     def __init__(self, track_file_path: str, labels_directory: Path):
         super().__init__()
         self.track_file_path = track_file_path
+        self._track_filename = Path(track_file_path).name
         self.labels_directory = labels_directory
         self.labels_directory.mkdir(exist_ok=True)
 
-        # Extract track ID from filename (the 5-digit prefix)
-        track_filename = Path(track_file_path).name
-        if track_filename.startswith(
-            ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9")
-        ):
-            # Extract the 5-digit prefix
-            self.track_id = track_filename[:5]
-        else:
-            # Fallback: use the full filename without extension
-            self.track_id = Path(track_file_path).stem
-
+        self.track_id = _track_id_for(track_file_path)
         self.labels_file = self.labels_directory / f"{self.track_id}.json"
         self._segments: List[LabelSegment] = []
+
+        # Read-only views of the segments, rebuilt lazily after mutations
+        self._segments_view: Optional[Tuple[LabelSegment, ...]] = None
+        self._starts: Optional[np.ndarray] = None
+        self._ends: Optional[np.ndarray] = None
+        self._max_ends: Optional[np.ndarray] = None  # Running maximum of ends
+        self._label_usage: Optional[Counter] = None  # label id -> segment count
+        self._is_sorted = True  # False while move_segment left starts unordered
+
+        # Bytes last written to labels_file, to skip rewriting identical content
+        self._saved_payload: Optional[bytes] = None
+
         self._load_labels()
 
+    def _invalidate_caches(self) -> None:
+        """Drop the cached segment views after the segments changed."""
+        self._segments_view = None
+        self._starts = None
+        self._ends = None
+        self._max_ends = None
+        self._label_usage = None
+
+    def _build_time_arrays(self) -> None:
+        """Build the start/end time arrays from the segments."""
+        self._starts = np.fromiter(
+            (segment.start_seconds for segment in self._segments),
+            dtype=np.float64,
+            count=len(self._segments),
+        )
+        self._ends = np.fromiter(
+            (segment.end_seconds for segment in self._segments),
+            dtype=np.float64,
+            count=len(self._segments),
+        )
+
+    @property
+    def starts_array(self) -> np.ndarray:
+        """Start times of all segments, in segment order (read-only use)."""
+        if self._starts is None:
+            self._build_time_arrays()
+        return self._starts
+
+    @property
+    def ends_array(self) -> np.ndarray:
+        """End times of all segments, in segment order (read-only use)."""
+        if self._ends is None:
+            self._build_time_arrays()
+        return self._ends
+
+    def _overlaps(self, start_seconds: float, end_seconds: float) -> bool:
+        """
+        Check whether a time range truly overlaps any segment.
+
+        Ranges that only touch a segment at a boundary do not count.
+
+        Args:
+            start_seconds: Start of the range
+            end_seconds: End of the range
+
+        Returns:
+            True if some segment overlaps the range
+        """
+        if not self._segments:
+            return False
+
+        starts = self.starts_array
+        ends = self.ends_array
+        if not self._is_sorted:
+            return bool(np.any((start_seconds < ends) & (end_seconds > starts)))
+
+        # Only segments starting before end_seconds can overlap, and one of
+        # them does iff the latest end among them lies after start_seconds
+        if self._max_ends is None:
+            self._max_ends = np.maximum.accumulate(ends)
+        k = int(np.searchsorted(starts, end_seconds, side="left"))
+        return k > 0 and bool(self._max_ends[k - 1] > start_seconds)
+
     def _load_labels(self) -> None:
         """Load labels from JSON file."""
+        self._invalidate_caches()
         if not self.labels_file.exists():
             self._create_empty_labels_file()
             return
 
         try:
-            with open(self.labels_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json(self.labels_file)
 
             self._segments.clear()
             label_key_candidates = ["labels", "segments"]
@@ -168,8 +411,7 @@ class TrackLabels(QObject):
                 raise ValueError(
                     f"Missing one of the keys {label_key_candidates} in labels file"
                 )
-            print(f"Using labels key: {labels_key}")
-            print(data[labels_key])
+            logger.debug("Using labels key: %s", labels_key)
 
             # Get the segments data
             segments_data = data.get(labels_key, [])
@@ -192,7 +434,6 @@ class TrackLabels(QObject):
             end_key = next(
                 (key for key in end_key_candidates if key in first_segment), None
             )
-            print(f"Found keys - id: {id_key}, start: {start_key}, end: {end_key}")
 
             if start_key is None or end_key is None:
                 raise ValueError(
@@ -204,10 +445,14 @@ class TrackLabels(QObject):
                     f"Missing one of the keys {id_key_candidates} in labels file"
                 )
 
-            print(f"Using id key: {id_key}, start key: {start_key}, end key: {end_key}")
+            logger.debug(
+                "Using id key: %s, start key: %s, end key: %s",
+                id_key,
+                start_key,
+                end_key,
+            )
 
             for segment_data in segments_data:
-                print(segment_data)
                 segment = LabelSegment(
                     label_id=segment_data[id_key],
                     start_seconds=segment_data[start_key],
@@ -216,40 +461,52 @@ class TrackLabels(QObject):
                 self._segments.append(segment)
 
             # Sort segments by start time
-            self._segments.sort(key=lambda s: s.start_seconds)
+            self._segments.sort(key=_start_of)
+            self._is_sorted = True
 
         except Exception as e:
-            print(f"Error loading labels: {e}")
+            logger.warning("Error loading labels: %s", e)
             self._segments.clear()
 
     def _create_empty_labels_file(self) -> None:
         """Create an empty labels file."""
         data = {
-            "track_file": Path(self.track_file_path).name,
+            "track_file": self._track_filename,
             "track_id": self.track_id,
             "labels": [],
         }
 
-        with open(self.labels_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        self._saved_payload = _dumps(data)
+        _write_json(self.labels_file, self._saved_payload)
 
     def _save_labels(self) -> None:
         """Save labels to JSON file."""
+        labels = [
+            {"label": label_id, "start": start, "end": end}
+            for label_id, start, end in zip(
+                map(_label_id_of, self._segments),
+                self.starts_array.tolist(),
+                self.ends_array.tolist(),
+            )
+        ]
+
+        # A segment move in progress leaves the list unordered; the file is
+        # always written in start order
+        if not self._is_sorted:
+            order = np.argsort(self.starts_array, kind="stable").tolist()
+            labels = [labels[i] for i in order]
+
         data = {
-            "track_file": Path(self.track_file_path).name,
+            "track_file": self._track_filename,
             "track_id": self.track_id,
-            "labels": [
-                {
-                    "label": segment.label_id,
-                    "start": segment.start_seconds,
-                    "end": segment.end_seconds,
-                }
-                for segment in self._segments
-            ],
+            "labels": labels,
         }
 
-        with open(self.labels_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # Skip the rewrite when the file already holds exactly these labels
+        payload = _dumps(data)
+        if payload != self._saved_payload:
+            _write_json(self.labels_file, payload)
+            self._saved_payload = payload
 
         self.labels_changed.emit()
 
@@ -280,24 +537,26 @@ class TrackLabels(QObject):
         else:  # annotation mode
             return self._add_segment_annotation(label_id, start_seconds, end_seconds)
 
+    def _insert_sorted(self, segment: LabelSegment) -> None:
+        """Insert a segment at its position by start time."""
+        if self._is_sorted:
+            bisect.insort(self._segments, segment, key=_start_of)
+        else:
+            self._segments.append(segment)
+            self._segments.sort(key=_start_of)
+            self._is_sorted = True
+
     def _add_segment_segmentation(
         self, label_id: str, start_seconds: float, end_seconds: float
     ) -> bool:
         """Add segment in segmentation mode (connected segments)."""
         # For connected segments, only check for overlaps if not connecting
         # Allow segments to connect at boundaries
-        for existing in self._segments:
-            if (
-                start_seconds < existing.end_seconds
-                and end_seconds > existing.start_seconds
-                and start_seconds != existing.end_seconds
-                and end_seconds != existing.start_seconds
-            ):
-                return False  # True overlap detected (not just touching)
-
-        segment = LabelSegment(label_id, start_seconds, end_seconds)
-        self._segments.append(segment)
-        self._segments.sort(key=lambda s: s.start_seconds)
+        if self._overlaps(start_seconds, end_seconds):
+            return False  # True overlap detected (not just touching)
+
+        self._insert_sorted(LabelSegment(label_id, start_seconds, end_seconds))
+        self._invalidate_caches()
         self._save_labels()
         return True
 
@@ -306,16 +565,45 @@ class TrackLabels(QObject):
     ) -> bool:
         """Add segment in annotation mode (free placement, overlaps allowed)."""
         # In annotation mode, segments can overlap freely
-        segment = LabelSegment(label_id, start_seconds, end_seconds)
-        self._segments.append(segment)
-        self._segments.sort(key=lambda s: s.start_seconds)
+        self._insert_sorted(LabelSegment(label_id, start_seconds, end_seconds))
+        self._invalidate_caches()
         self._save_labels()
         return True
 
     def update_segment_unchecked(
-        self, index: int, start_seconds: float, end_seconds: float
+        self, index: int, start_seconds: float, end_seconds: float, save: bool = True
+    ) -> bool:
+        """
+        Update a segment's timing without overlap checking (for connected segments).
+
+        Pass save=False to only change the in-memory segments, e.g. while a
+        boundary is being dragged; the caller is then responsible for calling
+        _save_labels() once the edit is finished.
+        """
+        if not (0 <= index < len(self._segments)):
+            return False
+
+        if start_seconds >= end_seconds:
+            return False
+
+        segment = self._segments.pop(index)
+        segment.start_seconds = start_seconds
+        segment.end_seconds = end_seconds
+        self._insert_sorted(segment)
+        self._invalidate_caches()
+        if save:
+            self._save_labels()
+        return True
+
+    def move_segment(
+        self, index: int, start_seconds: float, end_seconds: float, save: bool = True
     ) -> bool:
-        """Update a segment's timing without overlap checking (for connected segments)."""
+        """
+        Move a segment without re-sorting, so its index stays stable during a drag.
+
+        Overlaps are not checked (annotation mode). Call sort_segments() once
+        the drag is finished.
+        """
         if not (0 <= index < len(self._segments)):
             return False
 
@@ -324,14 +612,33 @@ class TrackLabels(QObject):
 
         self._segments[index].start_seconds = start_seconds
         self._segments[index].end_seconds = end_seconds
-        self._segments.sort(key=lambda s: s.start_seconds)
-        self._save_labels()
+        self._is_sorted = False
+        self._invalidate_caches()
+        if save:
+            self._save_labels()
         return True
 
+    def sort_segments(self) -> bool:
+        """
+        Restore start-time order after move_segment calls, e.g. once a drag ends.
+
+        Returns:
+            True if the segment order changed
+        """
+        if self._is_sorted:
+            return False
+
+        previous = list(self._segments)
+        self._segments.sort(key=_start_of)
+        self._is_sorted = True
+        self._invalidate_caches()
+        return any(a is not b for a, b in zip(previous, self._segments))
+
     def remove_segment(self, index: int) -> bool:
         """Remove a segment by index."""
         if 0 <= index < len(self._segments):
             del self._segments[index]
+            self._invalidate_caches()
             self._save_labels()
             return True
         return False
@@ -347,32 +654,59 @@ class TrackLabels(QObject):
             return False
 
         # Check for overlaps with other segments
-        for i, existing in enumerate(self._segments):
-            if i != index and (
-                start_seconds < existing.end_seconds
-                and end_seconds > existing.start_seconds
-            ):
-                return False  # Overlap detected
-
-        self._segments[index].start_seconds = start_seconds
-        self._segments[index].end_seconds = end_seconds
-        self._segments.sort(key=lambda s: s.start_seconds)
+        overlapping = (start_seconds < self.ends_array) & (
+            end_seconds > self.starts_array
+        )
+        overlapping[index] = False
+        if overlapping.any():
+            return False  # Overlap detected
+
+        segment = self._segments.pop(index)
+        segment.start_seconds = start_seconds
+        segment.end_seconds = end_seconds
+        self._insert_sorted(segment)
+        self._invalidate_caches()
         self._save_labels()
         return True
 
-    def get_segments(self) -> List[LabelSegment]:
-        """Get all label segments."""
-        return self._segments.copy()
+    def get_segments(self) -> Tuple[LabelSegment, ...]:
+        """
+        Get all label segments.
+
+        The returned tuple is shared between callers until the segments change;
+        use the mutation methods rather than modifying the segments in place.
+        """
+        if self._segments_view is None:
+            self._segments_view = tuple(self._segments)
+        return self._segments_view
+
+    def get_segment(self, index: int) -> Optional[LabelSegment]:
+        """Get a single segment by index, or None if out of range."""
+        if 0 <= index < len(self._segments):
+            return self._segments[index]
+        return None
+
+    def label_usage_count(self, label_id: str) -> int:
+        """Get the number of segments using a label."""
+        if self._label_usage is None:
+            self._label_usage = Counter(map(_label_id_of, self._segments))
+        return self._label_usage[label_id]
+
+    def segment_count(self) -> int:
+        """Get the number of segments."""
+        return len(self._segments)
 
     def get_last_segment_end(self) -> float:
         """Get the end time of the last segment, or 0.0 if no segments exist."""
         if not self._segments:
             return 0.0
-        return max(segment.end_seconds for segment in self._segments)
+        return float(self.ends_array.max())
 
     def clear_all_segments(self) -> None:
         """Clear all label segments."""
         self._segments.clear()
+        self._is_sorted = True
+        self._invalidate_caches()
         self._save_labels()
 
 
@@ -386,6 +720,7 @@ class LabelManager(QObject):
 
         # Load label configuration
         self.label_config = LabelConfig(config_file)
+        self._mode_cache: str = self.label_config.get_labeling_mode()
 
         # Current track labels
         self._current_track_labels: Optional[TrackLabels] = None
@@ -399,21 +734,36 @@ class LabelManager(QObject):
         """Get the currently loaded track labels."""
         return self._current_track_labels
 
-    def get_label_definitions(self) -> List[LabelDefinition]:
+    def get_label_definitions(self) -> Tuple[LabelDefinition, ...]:
         """Get all available label definitions."""
         return self.label_config.get_label_definitions()
 
+    @property
+    def config_version(self) -> int:
+        """Version number that changes whenever the label definitions change."""
+        return self.label_config.version
+
     def get_label_definition(self, label_id: str) -> Optional[LabelDefinition]:
         """Get a specific label definition."""
         return self.label_config.get_label_definition(label_id)
 
+    def get_label_definition_by_hotkey(self, hotkey: str) -> Optional[LabelDefinition]:
+        """Get the label definition bound to a hotkey."""
+        return self.label_config.get_label_definition_by_hotkey(hotkey)
+
     def get_labeling_mode(self) -> str:
         """Get the current labeling mode."""
-        return self.label_config.get_labeling_mode()
+        return self._mode_cache
 
     def set_labeling_mode(self, mode: str) -> None:
         """Set the labeling mode."""
         self.label_config.set_labeling_mode(mode)
+        self._mode_cache = mode
+
+    def reload_config(self) -> None:
+        """Reload the label configuration from its file."""
+        self.label_config._load_config()
+        self._mode_cache = self.label_config.get_labeling_mode()
 
     def set_project_directory(self, project_dir: Path) -> None:
         """Set a new project directory for the label manager."""
@@ -423,6 +773,7 @@ class LabelManager(QObject):
         # Update label configuration path
         config_file = project_dir / "musegproject.json"
         self.label_config = LabelConfig(config_file)
+        self._mode_cache = self.label_config.get_labeling_mode()
 
         # Clear current track labels as they're from the old project
         self._current_track_labels = None
@@ -430,10 +781,13 @@ class LabelManager(QObject):
     def remove_track_labels(self, track_file_path: str) -> bool:
         """Remove all labels for a specific track."""
         try:
-            track_labels = TrackLabels(track_file_path, self.labels_directory)
+            # Resolve the file directly; loading TrackLabels would parse it
+            # (or create it) only to delete it again
+            track_id = _track_id_for(track_file_path)
+            labels_file = self.labels_directory / f"{track_id}.json"
 
-            if track_labels.labels_file.exists():
-                track_labels.labels_file.unlink()
+            if labels_file.exists():
+                labels_file.unlink()
 
                 # Clear current track labels if this is the current track
                 if (
@@ -483,9 +837,7 @@ class LabelManager(QObject):
             definitions.append(label_def)
 
         # Update the label config
-        self.label_config._label_definitions = {
-            label_def.id: label_def for label_def in definitions
-        }
+        self.label_config.set_label_definitions(definitions)
 
     def is_label_in_use(self, label_name_or_id: str) -> bool:
         """Check if a label is currently being used in any segments."""
@@ -493,19 +845,17 @@ class LabelManager(QObject):
             return False
 
         # Find the label definition by name or ID
-        label_def = None
-        for definition in self.label_config.get_label_definitions():
-            if definition.name == label_name_or_id or definition.id == label_name_or_id:
-                label_def = definition
-                break
-
-        if not label_def:
+        label_id = self.label_config.resolve_label_id(label_name_or_id)
+        if label_id is None:
             return False
 
         # Check if any segments use this label
-        segments = self._current_track_labels.get_segments()
-        return any(segment.label_id == label_def.id for segment in segments)
+        return self._current_track_labels.label_usage_count(label_id) > 0
 
     def save_config(self) -> None:
         """Save the current configuration to file."""
         self.label_config._save_config()
+
+    def save_config_in_background(self) -> None:
+        """Save the current configuration without blocking on disk I/O."""
+        self.label_config.save_config_in_background()
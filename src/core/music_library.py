@@ -1,20 +1,84 @@
 """Music library management and file operations."""
 
+import os
 import shutil
 import re
+import logging
 from pathlib import Path
 from typing import List, Optional
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 
 from ..core.config import AppConfig
-from ..audio.processor import AudioProcessor
+from ..audio.processor import is_supported_format
+
+logger = logging.getLogger(__name__)
+
+# Library files are prefixed with a 5-digit track number, e.g. 00012_song.mp3
+_NUM_RE = re.compile(r"^(\d{5})_")
+
+
+def audio_file_sort_key(path: Path) -> tuple:
+    """
+    Sort key for library files: by track number prefix, then by name.
+
+    Args:
+        path: Path of the audio file
+
+    Returns:
+        Tuple suitable for sorting
+    """
+    return _name_sort_key(path.name)
+
+
+def _name_sort_key(filename: str) -> tuple:
+    """Sort key of a library file name; see audio_file_sort_key."""
+    # Check if filename starts with 5-digit number
+    number_match = _NUM_RE.match(filename)
+    if number_match:
+        return (int(number_match.group(1)), filename.lower())
+    else:
+        # Files without number prefix go at the end
+        return (999999, filename.lower())
+
+
+class _FileCopySignals(QObject):
+    """Signals emitted by file copy tasks from pool threads."""
+
+    copied = Signal(int, str)  # project_generation, dest_path
+    failed = Signal(int, str, str)  # project_generation, source_path, error_message
+
+
+class _FileCopyTask(QRunnable):
+    """Copies one file into the library on a QThreadPool thread."""
+
+    def __init__(
+        self,
+        source_path: str,
+        dest_path: Path,
+        project_generation: int,
+        signals: _FileCopySignals,
+    ):
+        super().__init__()
+        self._source_path = source_path
+        self._dest_path = dest_path
+        self._project_generation = project_generation
+        self._signals = signals
+
+    def run(self) -> None:
+        """Copy the file and report the result."""
+        try:
+            shutil.copy2(self._source_path, self._dest_path)
+            self._signals.copied.emit(self._project_generation, str(self._dest_path))
+        except Exception as e:
+            self._signals.failed.emit(
+                self._project_generation, self._source_path, str(e)
+            )
 
 
 class MusicLibrary(QObject):
     """Manages the music library and file operations."""
 
     # Signals
-    library_updated = Signal()
     file_added = Signal(str)  # file_path
     file_add_failed = Signal(str, str)  # file_path, error_message
     file_removed = Signal(str)  # file_path
@@ -26,13 +90,25 @@ class MusicLibrary(QObject):
         else:
             self._music_directory = AppConfig.get_music_directory()
         self._music_directory.mkdir(parents=True, exist_ok=True)
-        self._processor = AudioProcessor()
+
+        # Background copies started by add_files
+        self._copy_signals = _FileCopySignals()
+        self._copy_signals.copied.connect(self._on_file_copied)
+        self._copy_signals.failed.connect(self._on_file_copy_failed)
+        self._pending_copies = 0
+        self._next_track_number: Optional[int] = None  # Seeded by the first add
+
+        # Bumped per project switch; copies started for an earlier project
+        # still finish, but their results are dropped
+        self._project_generation = 0
 
     def set_project_directory(self, project_dir: Path) -> None:
         """Set a new project directory for the music library."""
         self._music_directory = project_dir / "music"
         self._music_directory.mkdir(parents=True, exist_ok=True)
-        self.library_updated.emit()
+        self._next_track_number = None
+        self._project_generation += 1
+        self._pending_copies = 0
 
     @property
     def music_directory(self) -> Path:
@@ -41,24 +117,24 @@ class MusicLibrary(QObject):
 
     def _get_next_track_number(self) -> int:
         """
-        Get the next available track number by examining existing files.
+        Get the next available track number.
+
+        The directory is scanned once; afterwards add_files advances the
+        counter itself, including numbers reserved for pending copies.
 
         Returns:
             Next available track number (0-based)
         """
-        existing_files = self.get_audio_files()
-        max_number = -1
+        if self._next_track_number is None:
+            max_number = -1
+            with os.scandir(self._music_directory) as entries:
+                for entry in entries:
+                    match = _NUM_RE.match(entry.name)
+                    if match and is_supported_format(entry.name):
+                        max_number = max(max_number, int(match.group(1)))
+            self._next_track_number = max_number + 1
 
-        # Pattern to match files starting with 5-digit numbers
-        number_pattern = re.compile(r"^(\d{5})_")
-
-        for file_path in existing_files:
-            match = number_pattern.match(file_path.name)
-            if match:
-                number = int(match.group(1))
-                max_number = max(max_number, number)
-
-        return max_number + 1
+        return self._next_track_number
 
     def get_audio_files(self) -> List[Path]:
         """
@@ -67,75 +143,99 @@ class MusicLibrary(QObject):
         Returns:
             List of Path objects for audio files, sorted by track number prefix
         """
-        audio_files = []
-        for file_path in self._music_directory.glob("*"):
-            if self._processor.is_supported_format(str(file_path)):
-                audio_files.append(file_path)
+        # scandir yields names and cached file types without a stat per entry;
+        # each match is decorated with its sort key so the sort compares
+        # plain tuples
+        with os.scandir(self._music_directory) as entries:
+            decorated = [
+                (_name_sort_key(entry.name), entry.path)
+                for entry in entries
+                if is_supported_format(entry.name)
+                and entry.is_file(follow_symlinks=False)
+            ]
+
+        # Files may have been added outside the app; rescan before the next add
+        # unless numbers are still reserved for copies in flight
+        if self._pending_copies == 0:
+            self._next_track_number = None
 
         # Sort files by track number prefix, then by name
-        def sort_key(path: Path) -> tuple:
-            filename = path.name
-            # Check if filename starts with 5-digit number
-            number_match = re.match(r"^(\d{5})_", filename)
-            if number_match:
-                return (int(number_match.group(1)), filename.lower())
-            else:
-                # Files without number prefix go at the end
-                return (999999, filename.lower())
-
-        return sorted(audio_files, key=sort_key)
+        decorated.sort()
+        return [Path(path) for _, path in decorated]
 
     def add_files(self, file_paths: List[str]) -> None:
         """
         Add files to the music library by copying them.
 
-        Args:
-            file_paths: List of file paths to add
-        """
-        for file_path in file_paths:
-            try:
-                self._add_single_file(file_path)
-            except Exception as e:
-                self.file_add_failed.emit(file_path, str(e))
-
-        self.library_updated.emit()
-
-    def _add_single_file(self, file_path: str) -> None:
-        """
-        Add a single file to the library.
+        Destination names are assigned here, then the files are copied in
+        parallel on the global thread pool. file_added / file_add_failed are
+        emitted per file once its copy has finished.
 
         Args:
-            file_path: Path to the file to add
-
-        Raises:
-            Exception: If file addition fails
+            file_paths: List of file paths to add
         """
-        source_path = Path(file_path)
-
-        # Check if file format is supported
-        if not self._processor.is_supported_format(file_path):
-            raise Exception(f"Unsupported file format: {source_path.suffix}")
-
-        # Generate destination path
-        dest_path = self._get_unique_destination_path(source_path)
-
-        # Copy file
-        shutil.copy2(file_path, dest_path)
-        self.file_added.emit(str(dest_path))
+        track_number = self._get_next_track_number()
+        pool = QThreadPool.globalInstance()
 
-    def _get_unique_destination_path(self, source_path: Path) -> Path:
+        for file_path in file_paths:
+            source_path = Path(file_path)
+
+            # Check if file format is supported
+            if not is_supported_format(file_path):
+                self.file_add_failed.emit(
+                    file_path, f"Unsupported file format: {source_path.suffix}"
+                )
+                continue
+
+            dest_path = self._get_unique_destination_path(source_path, track_number)
+            track_number += 1
+
+            self._pending_copies += 1
+            pool.start(
+                _FileCopyTask(
+                    file_path, dest_path, self._project_generation, self._copy_signals
+                )
+            )
+
+        self._next_track_number = track_number
+
+    def _on_file_copied(self, project_generation: int, dest_path: str) -> None:
+        """Handle a finished background copy."""
+        if project_generation != self._project_generation:
+            logger.debug("Ignoring copy into a previous project: %s", dest_path)
+            return
+
+        self._pending_copies -= 1
+        self.file_added.emit(dest_path)
+
+    def _on_file_copy_failed(
+        self, project_generation: int, source_path: str, error_message: str
+    ) -> None:
+        """Handle a failed background copy."""
+        if project_generation != self._project_generation:
+            logger.warning(
+                "Copy of %s into a previous project failed: %s",
+                source_path,
+                error_message,
+            )
+            return
+
+        self._pending_copies -= 1
+        self.file_add_failed.emit(source_path, error_message)
+
+    def _get_unique_destination_path(
+        self, source_path: Path, track_number: int
+    ) -> Path:
         """
-        Get a unique destination path with auto-incrementing number prefix.
+        Get a unique destination path with a number prefix.
 
         Args:
             source_path: Source file path
+            track_number: Track number to use as prefix
 
         Returns:
             Unique destination path with format: 00000_filename.ext
         """
-        # Get the next available track number
-        track_number = self._get_next_track_number()
-
         # Format as 5-digit number with leading zeros
         number_prefix = f"{track_number:05d}"
 
@@ -170,12 +270,11 @@ class MusicLibrary(QObject):
             if path.exists() and path.parent == self._music_directory:
                 path.unlink()
                 self.file_removed.emit(str(path))
-                self.library_updated.emit()
                 return True
             else:
                 return False
         except Exception as e:
-            print(f"Error removing file {file_path}: {e}")
+            logger.warning("Error removing file %s: %s", file_path, e)
             return False
 
     def file_exists(self, file_name: str) -> bool:
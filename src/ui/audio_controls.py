@@ -7,10 +7,70 @@ from PySide6.QtWidgets import (
     QSlider,
     QLabel,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 
 from ..core.config import UIColors
 
+# Play/pause button: green pill
+_PLAY_BUTTON_STYLESHEET = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 18px;
+        font-size: 12px;
+        font-weight: bold;
+        padding: 0px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+"""
+
+# Stop button: red pill
+_STOP_BUTTON_STYLESHEET = """
+    QPushButton {
+        background-color: #f44336;
+        color: white;
+        border: none;
+        border-radius: 16px;
+        font-size: 11px;
+        font-weight: bold;
+        padding: 0px;
+    }
+    QPushButton:hover {
+        background-color: #da190b;
+    }
+    QPushButton:pressed {
+        background-color: #a61e1e;
+    }
+"""
+
+# Volume slider with a green handle and filled groove
+_VOLUME_SLIDER_STYLESHEET = """
+    QSlider::groove:horizontal {
+        border: 1px solid #999999;
+        height: 6px;
+        background: #555;
+        margin: 2px 0;
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        background: #4CAF50;
+        border: 1px solid #4CAF50;
+        width: 16px;
+        margin: -5px 0;
+        border-radius: 8px;
+    }
+    QSlider::sub-page:horizontal {
+        background: #4CAF50;
+        border-radius: 3px;
+    }
+"""
+
 
 class ModernPlayControls(QWidget):
     """Modern compact play controls with volume control."""
@@ -40,62 +100,12 @@ class ModernPlayControls(QWidget):
         # Play/Pause button - modern circular design
         self.play_button = QPushButton("Play")
         self.play_button.setFixedSize(60, 36)
-        self.play_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 18px;
-                font-size: 12px;
-                font-weight: bold;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
+        self.play_button.setStyleSheet(_PLAY_BUTTON_STYLESHEET)
 
         # Stop button - modern circular design
         self.stop_button = QPushButton("Stop")
         self.stop_button.setFixedSize(50, 32)
-        self.stop_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 16px;
-                font-size: 11px;
-                font-weight: bold;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:pressed {
-                background-color: #a61e1e;
-            }
-        """)
-
-        self.stop_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 16px;
-                font-size: 11px;
-                font-weight: bold;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:pressed {
-                background-color: #a61e1e;
-            }
-        """)
+        self.stop_button.setStyleSheet(_STOP_BUTTON_STYLESHEET)
 
         # Volume control
         volume_label = QLabel("Volume:")
@@ -105,26 +115,7 @@ class ModernPlayControls(QWidget):
         self.volume_slider.setRange(0, 100)
         self.volume_slider.setValue(50)
         self.volume_slider.setFixedWidth(120)
-        self.volume_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                border: 1px solid #999999;
-                height: 6px;
-                background: #555;
-                margin: 2px 0;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #4CAF50;
-                border: 1px solid #4CAF50;
-                width: 16px;
-                margin: -5px 0;
-                border-radius: 8px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #4CAF50;
-                border-radius: 3px;
-            }
-        """)
+        self.volume_slider.setStyleSheet(_VOLUME_SLIDER_STYLESHEET)
 
         layout.addWidget(self.play_button)
         layout.addWidget(self.stop_button)
@@ -136,9 +127,12 @@ class ModernPlayControls(QWidget):
         """Connect signals."""
         self.play_button.clicked.connect(self.play_pause_requested.emit)
         self.stop_button.clicked.connect(self.stop_requested.emit)
-        self.volume_slider.valueChanged.connect(
-            lambda value: self.volume_changed.emit(value / 100.0)
-        )
+        self.volume_slider.valueChanged.connect(self._on_volume_changed)
+
+    @Slot(int)
+    def _on_volume_changed(self, value: int) -> None:
+        """Forward a slider value as a 0.0-1.0 volume."""
+        self.volume_changed.emit(value / 100.0)
 
     def update_play_state(self, is_playing: bool) -> None:
         """Update the play button state."""
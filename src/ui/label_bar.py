@@ -1,11 +1,14 @@
 """Label visualization bar that shows labeled segments."""
 
-from typing import List, Optional, Tuple
+import bisect
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
 from PySide6.QtWidgets import QWidget
-from PySide6.QtCore import Qt, Signal, QRect
-from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QFont
+from PySide6.QtCore import Qt, Signal, QRect, QTimer
+from PySide6.QtGui import QPainter, QColor, QBrush, QPen, QFont, QPixmap
 from PySide6.QtCore import QPoint
 
+from ..core.config import AppConfig
 from ..core.label_manager import LabelSegment, LabelDefinition
 
 
@@ -21,10 +24,14 @@ class LabelBar(QWidget):
     segment_moved = Signal(
         int, float, float
     )  # segment_index, new_start_time, new_end_time
+    segment_move_ended = Signal(int)  # segment_index
     boundary_drag_started = Signal(float)  # position where drag started
     boundary_drag_position = Signal(float)  # current drag position
     boundary_drag_ended = Signal()  # drag ended
 
+    # Keys that delete the selected segment
+    _DELETE_KEYS = frozenset({Qt.Key.Key_Delete, Qt.Key.Key_Backspace})
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(40)
@@ -32,10 +39,34 @@ class LabelBar(QWidget):
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)  # Enable keyboard focus
 
         # Data
-        self._segments: List[LabelSegment] = []
+        self._segments: Sequence[LabelSegment] = ()
         self._label_definitions: dict = {}  # label_id -> LabelDefinition
+        # label_id -> (brush, brush when selected)
+        self._brushes: Dict[str, Tuple[QBrush, QBrush]] = {}
+        # Brushes and label text of each segment, resolved from its label_id
+        self._segment_brushes: List[Tuple[QBrush, QBrush]] = []
+        self._segment_texts: List[str] = []
         self._duration: float = 0.0
 
+        # Segment x coordinates by segment index, and the same coordinates in
+        # ascending order with the matching segment indices, for hit testing
+        self._starts_x: List[int] = []
+        self._ends_x: List[int] = []
+        self._sorted_starts_x: List[int] = []
+        self._start_order: List[int] = []
+        self._sorted_ends_x: List[int] = []
+        self._end_order: List[int] = []
+        # Running maximum of the end x over the start-ordered segments
+        self._max_ends_x: List[int] = []
+        # Painted rectangle of each segment
+        self._segment_rects: List[QRect] = []
+        # Background and unselected segments, rendered on demand
+        self._segments_pixmap: Optional[QPixmap] = None
+        # Caches to rebuild before the next paint or hit test; setters only
+        # mark them, so several setter calls in a row rebuild once
+        self._styles_dirty = False
+        self._geometry_dirty = False
+
         # Interaction state
         self._dragging_boundary: Optional[Tuple[int, str]] = (
             None  # (segment_index, boundary_type)
@@ -53,13 +84,36 @@ class LabelBar(QWidget):
         self._hover_boundary: Optional[Tuple[int, str]] = None
         self._selected_segment: Optional[int] = None
 
-        # Visual settings - margins calculated to match matplotlib's actual plot area
-        # Matplotlib with tight_layout typically uses these margins for standard figure size
-        self._left_margin = 20
-        self._right_margin = 18
+        # Boundary drags are forwarded at most once per interval, with the
+        # latest position; mice can report moves far faster than we repaint
+        self._pending_drag_time: Optional[float] = None
+        self._drag_emit_timer = QTimer(self)
+        self._drag_emit_timer.setSingleShot(True)
+        self._drag_emit_timer.setInterval(AppConfig.DRAG_UPDATE_INTERVAL_MS)
+        self._drag_emit_timer.timeout.connect(self._flush_drag)
+
+        # Visual settings - margins shared with the waveform plot area
+        self._left_margin = AppConfig.PLOT_LEFT_MARGIN
+        self._right_margin = AppConfig.PLOT_RIGHT_MARGIN
         self._boundary_width = 3
         self._min_segment_width = 1
 
+        # Coordinate transform factors, refreshed on resize and duration changes
+        self._usable_width = self.width() - self._left_margin - self._right_margin
+        self._inv_duration = 0.0
+
+        # Painting resources, created once rather than on every paint
+        self._background_color = QColor("#2b2b2b")
+        self._muted_pen = QPen(QColor("#666666"), 1)
+        self._default_brushes = self._make_brushes("#888888")
+        self._selection_pen = QPen(QColor("#FFD700"), 3)  # Gold border
+        self._hover_pen = QPen(QColor("#FFFF00"), 3)  # Yellow for hover
+        self._drag_pen = QPen(QColor("#FF0000"), 3)  # Red for drag
+        self._text_pen = QPen(QColor("white"), 1)
+        self._text_font = QFont()
+        self._text_font.setPointSize(8)
+        self._text_font.setBold(True)
+
         # Mode setting - will be set by parent
         self._annotation_mode = False
 
@@ -69,18 +123,110 @@ class LabelBar(QWidget):
     def set_duration(self, duration_seconds: float) -> None:
         """Set the total duration for scaling."""
         self._duration = duration_seconds
+        self._inv_duration = 1.0 / duration_seconds if duration_seconds > 0 else 0.0
+        self._geometry_dirty = True
         self.update()
 
-    def set_segments(self, segments: List[LabelSegment]) -> None:
-        """Set the label segments to display."""
-        self._segments = segments.copy()
+    def set_segments(self, segments: Sequence[LabelSegment]) -> None:
+        """
+        Set the label segments to display.
+
+        The sequence is kept without copying, so callers must not modify it
+        afterwards; TrackLabels.get_segments hands out an immutable tuple.
+
+        Args:
+            segments: Segments to display, in label index order
+        """
+        self._segments = segments
+        self._styles_dirty = True
+        self._geometry_dirty = True
         self.update()
 
-    def set_label_definitions(self, label_definitions: List[LabelDefinition]) -> None:
+    def resizeEvent(self, event) -> None:
+        """Recompute segment coordinates for the new width."""
+        super().resizeEvent(event)
+        # Usable width accounts for left and right margins that match the waveform
+        self._usable_width = self.width() - self._left_margin - self._right_margin
+        self._geometry_dirty = True
+
+    def _ensure_caches(self) -> None:
+        """Rebuild the segment styles and geometry if a setter invalidated them."""
+        if self._styles_dirty:
+            self._styles_dirty = False
+            self._resolve_segment_styles()
+            self._segments_pixmap = None
+        if self._geometry_dirty:
+            self._geometry_dirty = False
+            self._rebuild_geometry()
+
+    def _rebuild_geometry(self) -> None:
+        """Recompute the segment x coordinates and the hit testing indexes."""
+        self._segments_pixmap = None
+
+        # Map all boundaries to pixels in one pass over arrays
+        n = len(self._segments)
+        starts = np.fromiter(
+            (s.start_seconds for s in self._segments), dtype=np.float64, count=n
+        )
+        ends = np.fromiter(
+            (s.end_seconds for s in self._segments), dtype=np.float64, count=n
+        )
+        starts_x = self._times_to_x(starts)
+        ends_x = self._times_to_x(ends)
+
+        # Stable sorts keep the lowest index first among equal coordinates
+        start_order = np.argsort(starts_x, kind="stable")
+        end_order = np.argsort(ends_x, kind="stable")
+
+        # Hit testing bisects plain lists, which is faster than numpy per call
+        self._starts_x = starts_x.tolist()
+        self._ends_x = ends_x.tolist()
+        self._start_order = start_order.tolist()
+        self._sorted_starts_x = starts_x[start_order].tolist()
+        self._end_order = end_order.tolist()
+        self._sorted_ends_x = ends_x[end_order].tolist()
+        self._max_ends_x = np.maximum.accumulate(ends_x[start_order]).tolist()
+
+        # Draw segment rectangles with proper vertical margins
+        top_margin = 5
+        height = self.height() - 2 * top_margin
+        widths = np.maximum(self._min_segment_width, ends_x - starts_x).tolist()
+        self._segment_rects = [
+            QRect(start_x, top_margin, width, height)
+            for start_x, width in zip(self._starts_x, widths)
+        ]
+
+    def set_label_definitions(
+        self, label_definitions: Sequence[LabelDefinition]
+    ) -> None:
         """Set the label definitions for colors and names."""
         self._label_definitions = {ld.id: ld for ld in label_definitions}
+        self._brushes = {
+            ld.id: self._make_brushes(ld.color) for ld in label_definitions
+        }
+        self._styles_dirty = True
         self.update()
 
+    def _resolve_segment_styles(self) -> None:
+        """Look up the brushes and label text of every segment once."""
+        self._segment_brushes = []
+        self._segment_texts = []
+        for segment in self._segments:
+            label_def = self._label_definitions.get(segment.label_id)
+            if label_def:
+                self._segment_brushes.append(self._brushes[segment.label_id])
+                self._segment_texts.append(label_def.name)
+            else:
+                self._segment_brushes.append(self._default_brushes)
+                self._segment_texts.append(str(segment.label_id))
+
+    @staticmethod
+    def _make_brushes(color: str) -> Tuple[QBrush, QBrush]:
+        """Get the normal and selected brushes for a segment color."""
+        base = QColor(color)
+        # Make color slightly brighter for selected segments
+        return QBrush(base), QBrush(base.lighter(120))
+
     def set_selected_segment(self, segment_index: Optional[int]) -> None:
         """Set the selected segment index."""
         if segment_index != self._selected_segment:
@@ -104,21 +250,24 @@ class LabelBar(QWidget):
         if self._duration <= 0:
             return self._left_margin
 
-        # Calculate usable width (account for left and right margins that match matplotlib)
-        total_width = self.width()
-        usable_width = total_width - self._left_margin - self._right_margin
-
         # Ensure we don't go outside bounds
-        ratio = min(1.0, max(0.0, time_seconds / self._duration))
-        return self._left_margin + int(ratio * usable_width)
+        ratio = min(1.0, max(0.0, time_seconds * self._inv_duration))
+        return self._left_margin + int(ratio * self._usable_width)
+
+    def _times_to_x(self, times: np.ndarray) -> np.ndarray:
+        """Convert an array of times to x coordinates, as _time_to_x does."""
+        if self._duration <= 0:
+            return np.full(len(times), self._left_margin, dtype=np.int64)
+
+        ratios = np.clip(times * self._inv_duration, 0.0, 1.0)
+        return self._left_margin + (ratios * self._usable_width).astype(np.int64)
 
     def _x_to_time(self, x: int) -> float:
         """Convert x coordinate to time, matching waveform alignment."""
         if self._duration <= 0:
             return 0.0
 
-        total_width = self.width()
-        usable_width = total_width - self._left_margin - self._right_margin
+        usable_width = self._usable_width
 
         # Clamp x to valid range
         relative_x = max(0, min(usable_width, x - self._left_margin))
@@ -126,113 +275,123 @@ class LabelBar(QWidget):
 
     def _get_boundary_at_pos(self, pos: QPoint) -> Optional[Tuple[int, str]]:
         """Get boundary (segment_index, boundary_type) at position."""
+        self._ensure_caches()
         tolerance = 5
-
-        for i, segment in enumerate(self._segments):
-            start_x = self._time_to_x(segment.start_seconds)
-            end_x = self._time_to_x(segment.end_seconds)
-
-            # Check start boundary
-            if abs(pos.x() - start_x) <= tolerance:
-                return (i, "start")
-
-            # Check end boundary
-            if abs(pos.x() - end_x) <= tolerance:
-                return (i, "end")
-
-        return None
+        x = pos.x()
+
+        # Boundaries within tolerance form a contiguous run of each sorted list
+        low = bisect.bisect_left(self._sorted_starts_x, x - tolerance)
+        high = bisect.bisect_right(self._sorted_starts_x, x + tolerance)
+        start_hits = self._start_order[low:high]
+        low = bisect.bisect_left(self._sorted_ends_x, x - tolerance)
+        high = bisect.bisect_right(self._sorted_ends_x, x + tolerance)
+        end_hits = self._end_order[low:high]
+
+        # Prefer the first segment, and its start over its end
+        if not start_hits and not end_hits:
+            return None
+        first = min(start_hits + end_hits)
+        return (first, "start" if first in start_hits else "end")
 
     def _get_segment_at_pos(self, pos: QPoint) -> Optional[int]:
         """Get segment index at position."""
-        for i, segment in enumerate(self._segments):
-            start_x = self._time_to_x(segment.start_seconds)
-            end_x = self._time_to_x(segment.end_seconds)
-
-            if start_x <= pos.x() <= end_x:
-                return i
-
-        return None
+        self._ensure_caches()
+        x = pos.x()
+
+        # Walk back over segments starting at or before x until none of the
+        # earlier ones can reach x; without overlaps that is a single step
+        hits = []
+        j = bisect.bisect_right(self._sorted_starts_x, x) - 1
+        while j >= 0 and self._max_ends_x[j] >= x:
+            i = self._start_order[j]
+            if self._ends_x[i] >= x:
+                hits.append(i)
+            j -= 1
+
+        # Prefer the first segment, as with overlapping segments
+        return min(hits) if hits else None
 
     def paintEvent(self, event):
         """Paint the label bar."""
+        self._ensure_caches()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Background
-        painter.fillRect(self.rect(), QColor("#2b2b2b"))
-
         if self._duration <= 0 or not self._segments:
             # Draw empty state
-            painter.setPen(QPen(QColor("#666666"), 1))
+            painter.fillRect(self.rect(), self._background_color)
+            painter.setPen(self._muted_pen)
             painter.drawText(
                 self.rect(), Qt.AlignmentFlag.AlignCenter, "No labels defined"
             )
             return
 
-        # Draw segments
-        for i, segment in enumerate(self._segments):
-            start_x = self._time_to_x(segment.start_seconds)
-            end_x = self._time_to_x(segment.end_seconds)
-            width = max(self._min_segment_width, end_x - start_x)
-
-            # Get label definition for color
-            label_def = self._label_definitions.get(segment.label_id)
-            if label_def:
-                color = QColor(label_def.color)
-            else:
-                color = QColor("#888888")  # Default color
-
-            # Draw segment rectangle with proper vertical margins
-            top_margin = 5
-            rect = QRect(start_x, top_margin, width, self.height() - 2 * top_margin)
-
-            # Highlight selected segment
-            if i == self._selected_segment:
-                # Draw selection border
-                painter.setPen(QPen(QColor("#FFD700"), 3))  # Gold border for selection
-                painter.drawRect(rect)
-                # Make color slightly brighter for selected segments
-                color = color.lighter(120)
-
-            painter.fillRect(rect, QBrush(color))
-
-            # Draw label text
-            if width > 40:  # Only draw text if there's enough space
-                painter.setPen(QPen(QColor("white"), 1))
-                font = QFont()
-                font.setPointSize(8)
-                font.setBold(True)
-                painter.setFont(font)
-
-                text = label_def.name if label_def else str(segment.label_id)
-                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
-
-            # Highlight boundaries if hovering or dragging
-            active_boundary = (
-                self._dragging_boundary
-                if self._dragging_boundary
-                else self._hover_boundary
+        # Segments only change with the data or the size; hover, drag and
+        # selection repaints blit the cached layer and draw on top of it
+        if self._segments_pixmap is None:
+            self._segments_pixmap = self._render_segments()
+        painter.drawPixmap(0, 0, self._segments_pixmap)
+        painter.setFont(self._text_font)
+
+        # Highlight selected segment
+        i = self._selected_segment
+        if i is not None and 0 <= i < len(self._segments):
+            # Draw selection border
+            painter.setPen(self._selection_pen)
+            painter.drawRect(self._segment_rects[i])
+            self._draw_segment(painter, i, self._segment_brushes[i][1])
+
+        # Highlight boundaries if hovering or dragging
+        active_boundary = (
+            self._dragging_boundary if self._dragging_boundary else self._hover_boundary
+        )
+        if active_boundary and active_boundary[0] < len(self._segments):
+            hover_index, hover_type = active_boundary
+            # Use different colors for hover vs drag
+            painter.setPen(
+                self._drag_pen if self._dragging_boundary else self._hover_pen
             )
-            if active_boundary:
-                hover_index, hover_type = active_boundary
-                if hover_index == i:
-                    # Use different colors for hover vs drag
-                    color = (
-                        QColor("#FF0000")
-                        if self._dragging_boundary
-                        else QColor("#FFFF00")
-                    )  # Red for drag, Yellow for hover
-                    painter.setPen(QPen(color, 3))
-                    if hover_type == "start":
-                        painter.drawLine(start_x, 5, start_x, self.height() - 5)
-                    elif hover_type == "end":
-                        painter.drawLine(end_x, 5, end_x, self.height() - 5)
+            if hover_type == "start":
+                x = self._starts_x[hover_index]
+            else:
+                x = self._ends_x[hover_index]
+            painter.drawLine(x, 5, x, self.height() - 5)
+
+    def _render_segments(self) -> QPixmap:
+        """Render the background, all segments and the time scale to a pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self._background_color)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._text_font)
+
+        # Draw segments from the coordinates cached by _rebuild_geometry
+        for i, (brush, _) in enumerate(self._segment_brushes):
+            self._draw_segment(painter, i, brush)
 
         # Draw time scale (optional - can be added later)
-        painter.setPen(QPen(QColor("#666666"), 1))
+        painter.setPen(self._muted_pen)
         y = self.height() - 2
         painter.drawLine(self._left_margin, y, self.width() - self._right_margin, y)
 
+        painter.end()
+        return pixmap
+
+    def _draw_segment(self, painter: QPainter, index: int, brush: QBrush) -> None:
+        """Fill a segment's rectangle and draw its label name if it fits."""
+        rect = self._segment_rects[index]
+        painter.fillRect(rect, brush)
+
+        # Draw label text
+        if rect.width() > 40:  # Only draw text if there's enough space
+            painter.setPen(self._text_pen)
+            painter.drawText(
+                rect, Qt.AlignmentFlag.AlignCenter, self._segment_texts[index]
+            )
+
     def mousePressEvent(self, event):
         """Handle mouse press for dragging boundaries and selecting segments."""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -273,15 +432,10 @@ class LabelBar(QWidget):
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging and hover effects."""
         if self._dragging_boundary and self._drag_start_pos:
-            # Handle boundary dragging
-            segment_index, boundary_type = self._dragging_boundary
-            new_time = self._x_to_time(event.pos().x())
-
-            # Emit boundary drag position for waveform indicator
-            self.boundary_drag_position.emit(new_time)
-
-            # Emit boundary moved signal with specific boundary type
-            self.boundary_moved.emit(segment_index, boundary_type, new_time)
+            # Handle boundary dragging; _flush_drag emits the latest position
+            self._pending_drag_time = self._x_to_time(event.pos().x())
+            if not self._drag_emit_timer.isActive():
+                self._drag_emit_timer.start()
 
         elif (
             self._dragging_segment is not None
@@ -332,22 +486,40 @@ class LabelBar(QWidget):
                 else:
                     self.setCursor(Qt.CursorShape.ArrowCursor)
 
+    def _flush_drag(self) -> None:
+        """Emit the pending boundary drag position, if any."""
+        if self._pending_drag_time is None or self._dragging_boundary is None:
+            return
+
+        segment_index, boundary_type = self._dragging_boundary
+        new_time = self._pending_drag_time
+        self._pending_drag_time = None
+
+        # Emit boundary drag position for waveform indicator
+        self.boundary_drag_position.emit(new_time)
+
+        # Emit boundary moved signal with specific boundary type
+        self.boundary_moved.emit(segment_index, boundary_type, new_time)
+
     def keyPressEvent(self, event):
         """Handle keyboard events for deleting segments."""
-        if event.key() == Qt.Key.Key_Delete or event.key() == Qt.Key.Key_Backspace:
-            if self._selected_segment is not None:
-                self.segment_deleted.emit(self._selected_segment)
-                self.clear_selection()
-                event.accept()
-                return
+        if self._selected_segment is not None and event.key() in self._DELETE_KEYS:
+            self.segment_deleted.emit(self._selected_segment)
+            self.clear_selection()
+            event.accept()
+            return
 
         super().keyPressEvent(event)
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release to end dragging."""
         if event.button() == Qt.MouseButton.LeftButton:
-            # Check if we were dragging a boundary
+            # Check if we were dragging a boundary, and forward its final
+            # position before ending the drag
             was_dragging_boundary = self._dragging_boundary is not None
+            moved_segment = self._dragging_segment
+            self._drag_emit_timer.stop()
+            self._flush_drag()
 
             self._dragging_boundary = None
             self._dragging_segment = None
@@ -359,3 +531,5 @@ class LabelBar(QWidget):
             # Emit boundary drag ended signal if we were dragging
             if was_dragging_boundary:
                 self.boundary_drag_ended.emit()
+            elif moved_segment is not None:
+                self.segment_move_ended.emit(moved_segment)
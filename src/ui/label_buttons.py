@@ -1,6 +1,7 @@
 """Label buttons widget for creating labeled segments."""
 
-from typing import List, Optional
+import functools
+from typing import Optional, Sequence
 from PySide6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -8,12 +9,61 @@ from PySide6.QtWidgets import (
     QLabel,
     QFrame,
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QFont
 
 from ..core.label_manager import LabelDefinition
 
 
+@functools.lru_cache(maxsize=256)
+def _darken_color(hex_color: str, factor: float = 0.2) -> str:
+    """Darken a hex color by a factor."""
+    # Decode all three channels in one call (the # is optional)
+    r, g, b = bytes.fromhex(hex_color.lstrip("#"))
+
+    # Darken
+    scale = 1 - factor
+    return "#%02x%02x%02x" % (int(r * scale), int(g * scale), int(b * scale))
+
+
+# Stylesheet of the buttons widget itself
+_FRAME_STYLESHEET = """
+    QFrame {
+        background-color: #3c3c3c;
+        border-radius: 8px;
+        padding: 5px;
+    }
+"""
+
+# Rules for label buttons of one color, selected by their labelColor property;
+# filled with the color (three times), then its hover and pressed shades
+_STYLE_TMPL = """
+    QPushButton[labelColor="%s"] {
+        background-color: %s;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 5px 15px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QPushButton[labelColor="%s"]:hover {
+        background-color: %s;
+    }
+    QPushButton[labelColor="%s"]:pressed {
+        background-color: %s;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _button_rules(color: str) -> str:
+    """Get the stylesheet rules for label buttons with the given color."""
+    hover = _darken_color(color)
+    pressed = _darken_color(color, 0.3)
+    return _STYLE_TMPL % (color, color, color, hover, color, pressed)
+
+
 class LabelButton(QPushButton):
     """Custom button for label creation."""
 
@@ -21,46 +71,13 @@ class LabelButton(QPushButton):
         super().__init__(label_def.name, parent)
         self.label_def = label_def
 
-        # Style the button with the label's color
+        # Styled by LabelButtonsWidget's stylesheet, which matches this property
         self.setFixedHeight(35)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {label_def.color};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 5px 15px;
-                font-weight: bold;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{
-                background-color: {self._darken_color(label_def.color)};
-            }}
-            QPushButton:pressed {{
-                background-color: {self._darken_color(label_def.color, 0.3)};
-            }}
-        """)
+        self.setProperty("labelColor", label_def.color)
 
         # Set tooltip
         self.setToolTip(f"{label_def.name}: {label_def.description}")
 
-    def _darken_color(self, hex_color: str, factor: float = 0.2) -> str:
-        """Darken a hex color by a factor."""
-        # Remove the # if present
-        hex_color = hex_color.lstrip("#")
-
-        # Convert to RGB
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-
-        # Darken
-        r = int(r * (1 - factor))
-        g = int(g * (1 - factor))
-        b = int(b * (1 - factor))
-
-        return f"#{r:02x}{g:02x}{b:02x}"
-
 
 class LabelButtonsWidget(QFrame):
     """Widget containing all label creation buttons."""
@@ -71,15 +88,9 @@ class LabelButtonsWidget(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(55)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #3c3c3c;
-                border-radius: 8px;
-                padding: 5px;
-            }
-        """)
-
-        self._label_definitions: List[LabelDefinition] = []
+        self.setStyleSheet(_FRAME_STYLESHEET)
+
+        self._label_definitions: Sequence[LabelDefinition] = ()
         self._current_position: float = 0.0
         self._setup_ui()
 
@@ -102,10 +113,19 @@ class LabelButtonsWidget(QFrame):
 
         layout.addStretch()
 
-    def set_label_definitions(self, label_definitions: List[LabelDefinition]) -> None:
+    def set_label_definitions(
+        self, label_definitions: Sequence[LabelDefinition]
+    ) -> None:
         """Set the available label definitions and create buttons."""
         self._label_definitions = label_definitions
 
+        # One stylesheet covers every button; Qt only reparses it when the
+        # set of colors changes
+        colors = dict.fromkeys(label_def.color for label_def in label_definitions)
+        stylesheet = _FRAME_STYLESHEET + "".join(map(_button_rules, colors))
+        if stylesheet != self.styleSheet():
+            self.setStyleSheet(stylesheet)
+
         # Clear existing buttons
         while self.buttons_layout.count():
             child = self.buttons_layout.takeAt(0)
@@ -115,11 +135,16 @@ class LabelButtonsWidget(QFrame):
         # Create buttons for each label
         for label_def in label_definitions:
             button = LabelButton(label_def)
-            button.clicked.connect(
-                lambda checked, lid=label_def.id: self.label_requested.emit(lid)
-            )
+            button.clicked.connect(self._on_button_clicked)
             self.buttons_layout.addWidget(button)
 
+    @Slot()
+    def _on_button_clicked(self) -> None:
+        """Request a label for the definition of the clicked button."""
+        button = self.sender()
+        if isinstance(button, LabelButton):
+            self.label_requested.emit(button.label_def.id)
+
     def set_current_position(self, position_seconds: float) -> None:
         """Update the current position for label creation."""
         self._current_position = position_seconds
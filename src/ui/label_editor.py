@@ -1,13 +1,15 @@
 """Label Editor Dialog for managing labels and labeling modes."""
 
+import re
+import functools
+from typing import Any, Dict, List
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QFormLayout,
     QGroupBox,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QLineEdit,
     QColorDialog,
@@ -18,12 +20,125 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QFrame,
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor, QIcon
+from PySide6.QtCore import Qt, Signal, QTimer, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor, QIcon, QPixmap
 
 from ..core.label_manager import LabelManager
 from ..core.config import AppConfig
 
+# Label IDs are word characters only (letters, digits and underscores)
+_ID_RE = re.compile(r"\w+")
+_NON_ID_CHAR_RE = re.compile(r"\W")
+
+# Text colors for label rows, shared by every row
+_WHITE = QColor("white")
+_BLACK = QColor("black")
+
+# Explanations shown for each labeling mode
+_MODE_DESCRIPTIONS = {
+    "segmentation": (
+        "Segmentation Mode:\n"
+        "• Labels form connected segments with no gaps\n"
+        "• New labels start where the previous label ends\n"
+        "• Moving boundaries affects adjacent labels\n"
+        "• Best for dividing audio into continuous sections"
+    ),
+    "annotation": (
+        "Annotation Mode:\n"
+        "• Labels can be placed freely with gaps and overlaps\n"
+        "• New labels are independent of existing ones\n"
+        "• Moving boundaries only affects the selected label\n"
+        "• Best for marking specific events or features"
+    ),
+}
+_NO_MODE_DESCRIPTION = "Select a labeling mode above."
+
+# Color offered for new labels when none is selected
+_DEFAULT_LABEL_COLOR = QColor(100, 150, 200)
+
+
+@functools.lru_cache(maxsize=256)
+def _qcolor(color_name: str) -> QColor:
+    """Get the QColor of a label color, parsing each color string once."""
+    return QColor(color_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _text_color_for(color_name: str) -> QColor:
+    """Get the text color (white or black) readable on a background color."""
+    color = _qcolor(color_name)
+    # Perceived brightness, scaled by 1000 to stay in integer arithmetic
+    brightness = color.red() * 299 + color.green() * 587 + color.blue() * 114
+    return _WHITE if brightness < 128000 else _BLACK
+
+
+class LabelsModel(QAbstractListModel):
+    """List model over the label dictionaries being edited."""
+
+    def __init__(self, parent=None):
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self._labels: List[Dict[str, Any]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of labels; the list has no child rows."""
+        return 0 if parent.isValid() else len(self._labels)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Get a label's display text, colors, or its dictionary for UserRole."""
+        if not index.isValid():
+            return None
+
+        label_data = self._labels[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Display both name and ID
+            label_id = label_data.get("id", "")
+            if label_id:
+                return f"{label_data['name']} ({label_id})"
+            return label_data["name"]
+        if role == Qt.ItemDataRole.BackgroundRole:
+            # Set color indicator
+            return _qcolor(label_data["color"])
+        if role == Qt.ItemDataRole.ForegroundRole:
+            # Set text color based on background brightness
+            return _text_color_for(label_data["color"])
+        if role == Qt.ItemDataRole.UserRole:
+            return label_data
+        return None
+
+    def labels(self) -> List[Dict[str, Any]]:
+        """Get the label dictionaries, in list order."""
+        return self._labels
+
+    def label(self, row: int) -> Dict[str, Any]:
+        """Get the label dictionary at a row; call update_label after editing it."""
+        return self._labels[row]
+
+    def set_labels(self, labels: List[Dict[str, Any]]) -> None:
+        """Replace all labels."""
+        self.beginResetModel()
+        self._labels = labels
+        self.endResetModel()
+
+    def append_label(self, label_data: Dict[str, Any]) -> int:
+        """Append a label and return its row."""
+        row = len(self._labels)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._labels.append(label_data)
+        self.endInsertRows()
+        return row
+
+    def remove_label(self, row: int) -> None:
+        """Remove the label at a row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._labels[row]
+        self.endRemoveRows()
+
+    def update_label(self, row: int) -> None:
+        """Notify views that the label at a row was edited in place."""
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
 
 class LabelEditor(QDialog):
     """Dialog for editing labels and configuring labeling modes."""
@@ -35,6 +150,21 @@ class LabelEditor(QDialog):
         super().__init__(parent)
         self.label_manager = label_manager
         self.setWindowTitle("MuSeg - Label Editor")
+
+        # Color shown on the color button, used for newly added labels
+        self._pending_color = _DEFAULT_LABEL_COLOR
+
+        # Typed ID and name changes are written to their row once typing pauses
+        self._pending_row = -1
+        self._commit_timer = QTimer(self)
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(AppConfig.LABEL_EDIT_DEBOUNCE_MS)
+        self._commit_timer.timeout.connect(self._commit_pending_edits)
+        # ID field text to restore when an invalid character is typed
+        self._last_valid_id = ""
+
+        # Mode whose description is shown, so re-selecting it skips the relayout
+        self._described_mode = None
         self.setModal(True)
         self.resize(500, 600)
 
@@ -81,9 +211,14 @@ class LabelEditor(QDialog):
         labels_group = QGroupBox("Labels")
         labels_layout = QVBoxLayout(labels_group)
 
-        # Label list
-        self.label_list = QListWidget()
-        self.label_list.itemSelectionChanged.connect(self._on_label_selection_changed)
+        # Label list; only visible rows are ever queried for their text and colors
+        self.labels_model = LabelsModel(self)
+        self.label_list = QListView()
+        self.label_list.setModel(self.labels_model)
+        self.label_list.setUniformItemSizes(True)
+        self.label_list.selectionModel().currentChanged.connect(
+            self._on_label_selection_changed
+        )
         labels_layout.addWidget(self.label_list)
 
         # Label editing controls
@@ -96,17 +231,23 @@ class LabelEditor(QDialog):
         
         self.id_edit = QLineEdit()
         self.id_edit.textChanged.connect(self._on_id_changed)
+        self.id_edit.editingFinished.connect(self._commit_pending_edits)
         self.id_edit.setPlaceholderText("Unique identifier (e.g. intro, verse, chorus)")
         form_layout.addRow("ID:", self.id_edit)
         
         self.name_edit = QLineEdit()
         self.name_edit.textChanged.connect(self._on_name_changed)
+        self.name_edit.editingFinished.connect(self._commit_pending_edits)
         self.name_edit.setPlaceholderText("Display name (e.g. Intro, Verse, Chorus)")
         form_layout.addRow("Name:", self.name_edit)
 
         color_layout = QHBoxLayout()
         self.color_button = QPushButton()
         self.color_button.setFixedSize(30, 30)
+        # The color is shown as an icon swatch, so the stylesheet is set only once
+        self.color_button.setStyleSheet("padding: 0px;")
+        self._color_swatch = QPixmap(26, 26)
+        self.color_button.setIconSize(self._color_swatch.size())
         self.color_button.clicked.connect(self._choose_color)
         self.color_label = QLabel("Click to change color")
         color_layout.addWidget(self.color_button)
@@ -156,163 +297,149 @@ class LabelEditor(QDialog):
         self._refresh_label_list()
 
     def _refresh_label_list(self):
-        """Refresh the label list widget."""
-        self.label_list.clear()
-
-        for label_data in self.label_manager.get_labels():
-            # Display both name and ID
-            display_text = f"{label_data['name']} ({label_data.get('id', '')})" if label_data.get('id') else label_data['name']
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, label_data)
-
-            # Set color indicator
-            color = QColor(label_data["color"])
-            item.setBackground(color)
+        """Refresh the label list from the label manager."""
+        self.labels_model.set_labels(self.label_manager.get_labels())
 
-            # Set text color based on background brightness
-            brightness = (
-                color.red() * 0.299 + color.green() * 0.587 + color.blue() * 0.114
-            )
-            text_color = QColor("white") if brightness < 128 else QColor("black")
-            item.setForeground(text_color)
-
-            self.label_list.addItem(item)
+    def _current_row(self) -> int:
+        """Get the row of the selected label, or -1 if none is selected."""
+        index = self.label_list.currentIndex()
+        return index.row() if index.isValid() else -1
 
     def _on_mode_changed(self):
         """Handle labeling mode change."""
         self._update_mode_description()
 
-        # Update the label manager
+        # Update the label manager; it saves its config, so skip unchanged modes
         selected_mode = self.mode_combo.currentData()
-        if selected_mode:
+        if selected_mode and selected_mode != self.label_manager.get_labeling_mode():
             self.label_manager.set_labeling_mode(selected_mode)
 
     def _update_mode_description(self):
         """Update the mode description text."""
         current_mode = self.mode_combo.currentData()
+        if current_mode == self._described_mode:
+            return
+        self._described_mode = current_mode
 
-        if current_mode == "segmentation":
-            description = (
-                "Segmentation Mode:\n"
-                "• Labels form connected segments with no gaps\n"
-                "• New labels start where the previous label ends\n"
-                "• Moving boundaries affects adjacent labels\n"
-                "• Best for dividing audio into continuous sections"
-            )
-        elif current_mode == "annotation":
-            description = (
-                "Annotation Mode:\n"
-                "• Labels can be placed freely with gaps and overlaps\n"
-                "• New labels are independent of existing ones\n"
-                "• Moving boundaries only affects the selected label\n"
-                "• Best for marking specific events or features"
-            )
-        else:
-            description = "Select a labeling mode above."
-
+        description = _MODE_DESCRIPTIONS.get(current_mode, _NO_MODE_DESCRIPTION)
         self.mode_description.setPlainText(description)
 
     def _on_label_selection_changed(self):
         """Handle label selection change."""
-        current_item = self.label_list.currentItem()
+        # Finish edits of the previously selected label first
+        self._commit_pending_edits()
+
+        row = self._current_row()
 
-        if current_item:
-            label_data = current_item.data(Qt.ItemDataRole.UserRole)
+        if row >= 0:
+            label_data = self.labels_model.label(row)
             self.id_edit.setText(label_data.get("id", ""))
             self.name_edit.setText(label_data["name"])
-            self._update_color_button(QColor(label_data["color"]))
+            self._update_color_button(_qcolor(label_data["color"]))
             self.remove_button.setEnabled(True)
         else:
             self.id_edit.clear()
             self.name_edit.clear()
-            self._update_color_button(QColor(100, 150, 200))
+            self._update_color_button(_DEFAULT_LABEL_COLOR)
             self.remove_button.setEnabled(False)
 
+        # Loading the fields is not an edit
+        self._commit_timer.stop()
+        self._pending_row = -1
+        self._last_valid_id = self.id_edit.text().strip()
+
     def _on_id_changed(self):
         """Handle ID edit change."""
-        current_item = self.label_list.currentItem()
-        if current_item and self.id_edit.text().strip():
-            label_data = current_item.data(Qt.ItemDataRole.UserRole)
+        row = self._current_row()
+        if row >= 0 and self.id_edit.text().strip():
             new_id = self.id_edit.text().strip()
             
             # Validate ID (alphanumeric and underscores only)
-            if not all(c.isalnum() or c == '_' for c in new_id):
-                # Reset to previous value
-                self.id_edit.setText(label_data.get("id", ""))
+            if not _ID_RE.fullmatch(new_id):
+                # Reset to the last valid value; its textChanged reschedules
+                # any pending edit, so the invalid text is never committed
+                self.id_edit.setText(self._last_valid_id)
                 return
-                
-            label_data["id"] = new_id
-            
-            # Update the display text to show both name and ID
-            current_item.setText(f"{label_data['name']} ({new_id})")
-            current_item.setData(Qt.ItemDataRole.UserRole, label_data)
+
+            self._last_valid_id = new_id
+            self._schedule_commit(row)
 
     def _on_name_changed(self):
         """Handle name edit change."""
-        current_item = self.label_list.currentItem()
-        if current_item and self.name_edit.text().strip():
-            label_data = current_item.data(Qt.ItemDataRole.UserRole)
-            label_data["name"] = self.name_edit.text().strip()
-            
-            # Update the display text to show both name and ID
-            label_id = label_data.get("id", "")
-            current_item.setText(f"{label_data['name']} ({label_id})" if label_id else label_data['name'])
-            current_item.setData(Qt.ItemDataRole.UserRole, label_data)
+        row = self._current_row()
+        if row >= 0 and self.name_edit.text().strip():
+            self._schedule_commit(row)
+
+    def _schedule_commit(self, row: int):
+        """Write the typed ID and name to a row once typing pauses."""
+        self._pending_row = row
+        self._commit_timer.start()
+
+    def _commit_pending_edits(self):
+        """Write the typed ID and name to their row now, if an edit is pending."""
+        self._commit_timer.stop()
+        row = self._pending_row
+        self._pending_row = -1
+        if row < 0:
+            return
+
+        label_data = self.labels_model.label(row)
+        new_id = self.id_edit.text().strip()
+        new_name = self.name_edit.text().strip()
+        if _ID_RE.fullmatch(new_id):
+            label_data["id"] = new_id
+        if new_name:
+            label_data["name"] = new_name
+
+        # Update the display text to show both name and ID
+        self.labels_model.update_label(row)
 
     def _choose_color(self):
         """Open color picker dialog."""
-        current_item = self.label_list.currentItem()
-        current_color = QColor(100, 150, 200)
+        self._commit_pending_edits()
+        row = self._current_row()
+        current_color = _DEFAULT_LABEL_COLOR
 
-        if current_item:
-            label_data = current_item.data(Qt.ItemDataRole.UserRole)
-            current_color = QColor(label_data["color"])
+        if row >= 0:
+            current_color = _qcolor(self.labels_model.label(row)["color"])
 
         color = QColorDialog.getColor(current_color, self, "Choose Label Color")
 
         if color.isValid():
             self._update_color_button(color)
 
-            if current_item:
-                label_data = current_item.data(Qt.ItemDataRole.UserRole)
-                label_data["color"] = color.name()
-                current_item.setData(Qt.ItemDataRole.UserRole, label_data)
-
+            if row >= 0:
                 # Update item appearance
-                current_item.setBackground(color)
-                brightness = (
-                    color.red() * 0.299 + color.green() * 0.587 + color.blue() * 0.114
-                )
-                text_color = QColor("white") if brightness < 128 else QColor("black")
-                current_item.setForeground(text_color)
+                self.labels_model.label(row)["color"] = color.name()
+                self.labels_model.update_label(row)
 
     def _update_color_button(self, color: QColor):
         """Update the color button appearance."""
-        self.color_button.setStyleSheet(f"background-color: {color.name()};")
+        self._pending_color = color
+        self._color_swatch.fill(color)
+        self.color_button.setIcon(QIcon(self._color_swatch))
 
     def _add_label(self):
         """Add a new label."""
+        self._commit_pending_edits()
         name = self.name_edit.text().strip()
         label_id = self.id_edit.text().strip()
         
         if not name:
-            name = f"Label {self.label_list.count() + 1}"
+            name = f"Label {self.labels_model.rowCount() + 1}"
             
         if not label_id:
             # Generate ID from name
             label_id = name.lower().replace(" ", "_").replace("-", "_")
             # Remove any non-alphanumeric characters except underscores
-            label_id = ''.join(c if c.isalnum() or c == '_' else '' for c in label_id)
-
-        # Check for duplicate names and IDs
-        existing_names = [
-            self.label_list.item(i).data(Qt.ItemDataRole.UserRole)["name"] 
-            for i in range(self.label_list.count())
-        ]
-        existing_ids = [
-            self.label_list.item(i).data(Qt.ItemDataRole.UserRole).get("id", "") 
-            for i in range(self.label_list.count())
-        ]
+            label_id = _NON_ID_CHAR_RE.sub('', label_id)
+
+        # Check for duplicate names and IDs, collected in one pass
+        existing_names = set()
+        existing_ids = set()
+        for label_data in self.labels_model.labels():
+            existing_names.add(label_data["name"])
+            existing_ids.add(label_data.get("id", ""))
         
         if name in existing_names:
             base_name = name
@@ -328,12 +455,8 @@ class LabelEditor(QDialog):
                 counter += 1
             label_id = f"{base_id}_{counter}"
 
-        # Get color from button or use default
-        color = QColor(100, 150, 200)
-        button_style = self.color_button.styleSheet()
-        if "background-color:" in button_style:
-            color_str = button_style.split("background-color:")[1].split(";")[0].strip()
-            color = QColor(color_str)
+        # Use the color shown on the button
+        color = self._pending_color
 
         # Create new label data
         label_data = {
@@ -345,16 +468,8 @@ class LabelEditor(QDialog):
         }
 
         # Add to list
-        item = QListWidgetItem(f"{name} ({label_id})")
-        item.setData(Qt.ItemDataRole.UserRole, label_data)
-        item.setBackground(color)
-
-        brightness = color.red() * 0.299 + color.green() * 0.587 + color.blue() * 0.114
-        text_color = QColor("white") if brightness < 128 else QColor("black")
-        item.setForeground(text_color)
-
-        self.label_list.addItem(item)
-        self.label_list.setCurrentItem(item)
+        row = self.labels_model.append_label(label_data)
+        self.label_list.setCurrentIndex(self.labels_model.index(row))
 
         # Clear fields for next label
         self.id_edit.clear()
@@ -362,11 +477,12 @@ class LabelEditor(QDialog):
 
     def _remove_label(self):
         """Remove the selected label."""
-        current_item = self.label_list.currentItem()
-        if not current_item:
+        self._commit_pending_edits()
+        row = self._current_row()
+        if row < 0:
             return
 
-        label_data = current_item.data(Qt.ItemDataRole.UserRole)
+        label_data = self.labels_model.label(row)
         label_identifier = label_data.get("id", label_data["name"])
 
         # Check if label is in use
@@ -384,19 +500,17 @@ class LabelEditor(QDialog):
                 return
 
         # Remove from list
-        row = self.label_list.row(current_item)
-        self.label_list.takeItem(row)
+        self.labels_model.remove_label(row)
 
     def accept(self):
         """Save changes and close dialog."""
+        self._commit_pending_edits()
         try:
             # Collect all labels from the list
             labels = []
             ids_used = set()
             
-            for i in range(self.label_list.count()):
-                item = self.label_list.item(i)
-                label_data = item.data(Qt.ItemDataRole.UserRole)
+            for i, label_data in enumerate(self.labels_model.labels()):
                 
                 # Validate required fields
                 if not label_data.get("name", "").strip():
@@ -407,8 +521,11 @@ class LabelEditor(QDialog):
                     QMessageBox.warning(self, "Validation Error", f"Label '{label_data['name']}' is missing an ID.")
                     return
                     
-                # Check for duplicate IDs
+                # Check for invalid and duplicate IDs
                 label_id = label_data["id"]
+                if not _ID_RE.fullmatch(label_id):
+                    QMessageBox.warning(self, "Validation Error", f"ID '{label_id}' may only contain letters, digits and underscores.")
+                    return
                 if label_id in ids_used:
                     QMessageBox.warning(self, "Validation Error", f"Duplicate ID '{label_id}' found. Each label must have a unique ID.")
                     return
@@ -419,8 +536,8 @@ class LabelEditor(QDialog):
             # Update label manager
             self.label_manager.set_labels(labels)
 
-            # Save to config
-            self.label_manager.save_config()
+            # Save to config; the write finishes after the dialog closes
+            self.label_manager.save_config_in_background()
 
             # Emit signal
             self.labels_changed.emit()
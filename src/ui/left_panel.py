@@ -59,7 +59,6 @@ class LeftPanel(QFrame):
         self.remove_button = QPushButton("Remove Selected File")
         self.remove_button.setEnabled(False)  # Disabled until a file is selected
         layout.addWidget(self.remove_button)
-        layout.addWidget(self.remove_button)
 
     def _connect_signals(self) -> None:
         """Connect internal signals."""
@@ -90,6 +89,27 @@ class LeftPanel(QFrame):
         """
         self.music_list.refresh_from_file_list([str(path) for path in file_paths])
 
+    def add_file(self, file_path: str) -> None:
+        """
+        Add a single file to the music list without rebuilding it.
+
+        Args:
+            file_path: Path of the added file
+        """
+        self.music_list.insert_audio_file(file_path)
+
+    def remove_file(self, file_path: str) -> None:
+        """
+        Remove a single file from the music list without rebuilding it.
+
+        Args:
+            file_path: Path of the removed file
+        """
+        self.music_list.remove_audio_file(file_path)
+        self.remove_button.setEnabled(
+            self.music_list.isEnabled() and bool(self.get_selected_file_path())
+        )
+
     def get_selected_file_path(self) -> str:
         """Get the currently selected file path."""
         return self.music_list.get_selected_file_path()
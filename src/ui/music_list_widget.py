@@ -1,18 +1,98 @@
 """Music library list widget with drag and drop support."""
 
+import os
 from pathlib import Path
-from typing import List
-from PySide6.QtWidgets import QListWidget, QListWidgetItem
-from PySide6.QtCore import Signal
+from typing import Any, List
+from PySide6.QtWidgets import QListView
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Signal
 from PySide6.QtGui import QDragEnterEvent, QDropEvent
 from PySide6.QtCore import Qt
 
 from ..core.config import UIStyles
-from ..audio.processor import AudioProcessor
+from ..core.music_library import audio_file_sort_key
+from ..audio.processor import is_supported_format
 
+# Roles answered by AudioListModel, resolved once instead of per data() call
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_PATH_ROLES = frozenset({Qt.ItemDataRole.UserRole, Qt.ItemDataRole.ToolTipRole})
 
-class MusicListWidget(QListWidget):
-    """Custom list widget for music library with drag and drop support."""
+
+class AudioListModel(QAbstractListModel):
+    """List model of library files backed by parallel path and name lists."""
+
+    def __init__(self, parent=None):
+        """Initialize an empty model."""
+        super().__init__(parent)
+        self._paths: List[str] = []
+        self._names: List[str] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get the number of files; the list has no child rows."""
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE) -> Any:
+        """Get the file name for display, or the full path for the other roles."""
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == _DISPLAY_ROLE:
+            return self._names[row]
+        if role in _PATH_ROLES:
+            return self._paths[row]  # Show full path on hover
+        return None
+
+    def set_files(self, file_paths: List[str]) -> None:
+        """
+        Replace all files of the model.
+
+        Args:
+            file_paths: List of file paths, in display order
+        """
+        self.beginResetModel()
+        self._paths = list(file_paths)
+        self._names = [os.path.basename(file_path) for file_path in self._paths]
+        self.endResetModel()
+
+    def insert_file(self, row: int, file_path: str) -> None:
+        """
+        Insert a file at the given row.
+
+        Args:
+            row: Row to insert at
+            file_path: Path to the audio file
+        """
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._paths.insert(row, file_path)
+        self._names.insert(row, os.path.basename(file_path))
+        self.endInsertRows()
+
+    def remove_file(self, row: int) -> None:
+        """
+        Remove the file at the given row.
+
+        Args:
+            row: Row to remove
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._paths[row]
+        del self._names[row]
+        self.endRemoveRows()
+
+    def file_path(self, row: int) -> str:
+        """Get the file path at the given row."""
+        return self._paths[row]
+
+    def row_of(self, file_path: str) -> int:
+        """Get the row of a file path, or -1 if it is not in the model."""
+        try:
+            return self._paths.index(file_path)
+        except ValueError:
+            return -1
+
+
+class MusicListWidget(QListView):
+    """Custom list view for music library with drag and drop support."""
 
     # Signals
     files_dropped = Signal(list)  # List of file paths
@@ -22,42 +102,91 @@ class MusicListWidget(QListWidget):
         """Initialize the music list widget."""
         super().__init__(parent)
 
+        # Rows only materialize when visible; equal row heights let the view
+        # size its scrollbar without measuring every row
+        self._model = AudioListModel(self)
+        self.setModel(self._model)
+        self.setUniformItemSizes(True)
+
         # Setup drag and drop
         self.setAcceptDrops(True)
-        self.setDragDropMode(QListWidget.DragDropMode.DropOnly)
+        self.setDragDropMode(QListView.DragDropMode.DropOnly)
 
-        # Apply styling
-        self.setStyleSheet(UIStyles.LIST_WIDGET_STYLESHEET)
+        # Styled by the application stylesheet
+        self.setObjectName(UIStyles.MUSIC_LIST_NAME)
 
         # Connect signals
-        self.currentItemChanged.connect(self._on_current_item_changed)
-
-        # Audio processor for format checking
-        self._processor = AudioProcessor()
+        self.selectionModel().currentChanged.connect(self._on_current_changed)
 
     def add_audio_file(self, file_path: str) -> None:
         """
-        Add an audio file to the list.
+        Add an audio file to the end of the list.
 
         Args:
             file_path: Path to the audio file
         """
-        path = Path(file_path)
-        item = QListWidgetItem(path.name)
-        item.setData(Qt.ItemDataRole.UserRole, str(file_path))
-        item.setToolTip(str(path))  # Show full path on hover
-        self.addItem(item)
+        self._model.insert_file(self._model.rowCount(), file_path)
+
+    def insert_audio_file(self, file_path: str) -> None:
+        """
+        Insert an audio file at its sorted position in the list.
+
+        Args:
+            file_path: Path to the audio file
+        """
+        key = audio_file_sort_key(Path(file_path))
+
+        # Binary search over the already sorted rows
+        low, high = 0, self._model.rowCount()
+        while low < high:
+            middle = (low + high) // 2
+            item_path = self._model.file_path(middle)
+            if audio_file_sort_key(Path(item_path)) <= key:
+                low = middle + 1
+            else:
+                high = middle
+
+        self._model.insert_file(low, file_path)
+
+    def remove_audio_file(self, file_path: str) -> bool:
+        """
+        Remove an audio file from the list.
+
+        Removing the selected file clears the selection without emitting
+        track_selected for a neighbouring item.
+
+        Args:
+            file_path: Path to the audio file
+
+        Returns:
+            True if the file was found and removed
+        """
+        row = self._model.row_of(file_path)
+        if row < 0:
+            return False
+
+        selection = self.selectionModel()
+        was_current = selection.currentIndex().row() == row
+        selection.blockSignals(True)
+        self._model.remove_file(row)
+        if was_current:
+            selection.clearCurrentIndex()
+            selection.clearSelection()
+        selection.blockSignals(False)
+        self.viewport().update()
+        return True
 
     def refresh_from_file_list(self, file_paths: List[str]) -> None:
         """
         Refresh the list from a list of file paths.
 
+        The model is reset once for the whole list, so the view relayouts and
+        repaints once and the selection changes once, whatever the file count.
+
         Args:
             file_paths: List of file paths to display
         """
-        self.clear()
-        for file_path in file_paths:
-            self.add_audio_file(file_path)
+        self._model.set_files(file_paths)
 
     def get_selected_file_path(self) -> str:
         """
@@ -66,9 +195,9 @@ class MusicListWidget(QListWidget):
         Returns:
             File path string, empty if no selection
         """
-        current_item = self.currentItem()
-        if current_item:
-            return current_item.data(Qt.ItemDataRole.UserRole)
+        current = self.selectionModel().currentIndex()
+        if current.isValid():
+            return self._model.file_path(current.row())
         return ""
 
     def select_file(self, file_path: str) -> bool:
@@ -81,24 +210,21 @@ class MusicListWidget(QListWidget):
         Returns:
             True if file was found and selected
         """
-        for i in range(self.count()):
-            item = self.item(i)
-            if item and item.data(Qt.ItemDataRole.UserRole) == file_path:
-                self.setCurrentItem(item)
-                return True
-        return False
+        row = self._model.row_of(file_path)
+        if row < 0:
+            return False
+        self.setCurrentIndex(self._model.index(row))
+        return True
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """Handle drag enter events."""
         if event.mimeData().hasUrls():
-            # Check if any of the dragged files are supported
-            supported_files = []
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if self._processor.is_supported_format(file_path):
-                    supported_files.append(file_path)
-
-            if supported_files:
+            # Check if any of the dragged files are supported, stopping at
+            # the first match
+            if any(
+                is_supported_format(url.toLocalFile())
+                for url in event.mimeData().urls()
+            ):
                 event.acceptProposedAction()
             else:
                 event.ignore()
@@ -107,11 +233,11 @@ class MusicListWidget(QListWidget):
 
     def dropEvent(self, event: QDropEvent) -> None:
         """Handle drop events."""
-        supported_files = []
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if self._processor.is_supported_format(file_path):
-                supported_files.append(file_path)
+        supported_files = [
+            file_path
+            for file_path in (url.toLocalFile() for url in event.mimeData().urls())
+            if is_supported_format(file_path)
+        ]
 
         if supported_files:
             self.files_dropped.emit(supported_files)
@@ -119,11 +245,9 @@ class MusicListWidget(QListWidget):
         else:
             super().dropEvent(event)
 
-    def _on_current_item_changed(
-        self, current: QListWidgetItem, previous: QListWidgetItem
-    ) -> None:
+    def _on_current_changed(self, current: QModelIndex, previous: QModelIndex) -> None:
         """Handle item selection changes."""
-        if current:
-            file_path = current.data(Qt.ItemDataRole.UserRole)
+        if current.isValid():
+            file_path = self._model.file_path(current.row())
             if file_path:
                 self.track_selected.emit(file_path)
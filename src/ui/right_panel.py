@@ -21,15 +21,13 @@ class RightPanel(QWidget):
     stop_requested = Signal()
     volume_changed = Signal(float)
     waveform_position_changed = Signal(float)  # Position in seconds
-    label_requested = Signal(str, float)  # label_id, position_seconds
-    label_boundary_moved = Signal(
-        int, str, float
-    )  # segment_index, boundary_type, new_time
-    label_segment_selected = Signal(int)  # segment_index
-    label_segment_deleted = Signal(int)  # segment_index
-    label_segment_moved = Signal(
-        int, float, float
-    )  # segment_index, new_start_time, new_end_time
+    # Label editing commands as (command, args):
+    #   "create"         (label_id, position_seconds)
+    #   "move_boundary"  (segment_index, boundary_type, new_time)
+    #   "select"         (segment_index,)
+    #   "delete"         (segment_index,)
+    #   "move_segment"   (segment_index, new_start_time, new_end_time)
+    label_command = Signal(str, object)
     loading_state_changed = Signal(bool)  # True when loading, False when done
 
     def __init__(self, parent=None):
@@ -108,10 +106,11 @@ class RightPanel(QWidget):
         self.label_buttons.label_requested.connect(self._on_label_requested)
 
         # Label bar signals
-        self.label_bar.boundary_moved.connect(self.label_boundary_moved.emit)
-        self.label_bar.segment_selected.connect(self.label_segment_selected.emit)
-        self.label_bar.segment_deleted.connect(self.label_segment_deleted.emit)
-        self.label_bar.segment_moved.connect(self.label_segment_moved.emit)
+        self.label_bar.boundary_moved.connect(self._on_boundary_moved)
+        self.label_bar.segment_selected.connect(self._on_segment_selected)
+        self.label_bar.segment_deleted.connect(self._on_segment_deleted)
+        self.label_bar.segment_moved.connect(self._on_segment_moved)
+        self.label_bar.segment_move_ended.connect(self._on_segment_move_ended)
 
         # Connect boundary dragging signals for waveform feedback
         self.label_bar.boundary_drag_started.connect(self.show_drag_position)
@@ -121,7 +120,35 @@ class RightPanel(QWidget):
     def _on_label_requested(self, label_id: str) -> None:
         """Handle label creation request."""
         current_position = self.label_buttons.get_current_position()
-        self.label_requested.emit(label_id, current_position)
+        self.label_command.emit("create", (label_id, current_position))
+
+    def _on_boundary_moved(
+        self, segment_index: int, boundary_type: str, new_time: float
+    ) -> None:
+        """Forward a boundary move from the label bar."""
+        self.label_command.emit(
+            "move_boundary", (segment_index, boundary_type, new_time)
+        )
+
+    def _on_segment_selected(self, segment_index: int) -> None:
+        """Forward a segment selection from the label bar."""
+        self.label_command.emit("select", (segment_index,))
+
+    def _on_segment_deleted(self, segment_index: int) -> None:
+        """Forward a segment deletion from the label bar."""
+        self.label_command.emit("delete", (segment_index,))
+
+    def _on_segment_moved(
+        self, segment_index: int, new_start_time: float, new_end_time: float
+    ) -> None:
+        """Forward a segment move from the label bar."""
+        self.label_command.emit(
+            "move_segment", (segment_index, new_start_time, new_end_time)
+        )
+
+    def _on_segment_move_ended(self, segment_index: int) -> None:
+        """Forward the end of a segment move from the label bar."""
+        self.label_command.emit("end_segment_move", (segment_index,))
 
     def set_track_loading(self, track_name: str) -> None:
         """
@@ -176,17 +203,6 @@ class RightPanel(QWidget):
         """
         return self.waveform_widget.load_audio_data(audio_data)
 
-    def update_waveform_position(self, position_seconds: float) -> None:
-        """
-        Update the position indicator on the waveform.
-
-        Args:
-            position_seconds: Current position in seconds
-        """
-        self.waveform_widget.update_position(position_seconds)
-        # Also update the label buttons' current position so they use the playback position
-        self.label_buttons.set_current_position(position_seconds)
-
     def set_playback_state(self, state: QMediaPlayer.PlaybackState) -> None:
         """
         Update controls based on playback state.
@@ -198,26 +214,16 @@ class RightPanel(QWidget):
         is_playing = state == QMediaPlayer.PlaybackState.PlayingState
         self.play_controls.update_play_state(is_playing)
 
-    def set_duration(self, duration_ms: int) -> None:
-        """
-        Set the total duration (no longer needed without position slider).
-
-        Args:
-            duration_ms: Duration in milliseconds
-        """
-        # Duration display no longer needed since we removed the position slider
-        pass
-
     def set_position(self, position_ms: int) -> None:
         """
-        Set the current position (only update waveform now).
+        Show the player position on the waveform and label buttons.
 
         Args:
             position_ms: Position in milliseconds
         """
-        # Only update waveform position since we removed the position slider
         position_seconds = position_ms / 1000.0
-        self.update_waveform_position(position_seconds)
+        self.waveform_widget.update_position(position_seconds)
+        self.label_buttons.set_current_position(position_seconds)
 
     def reset(self) -> None:
         """Reset the panel to initial state."""
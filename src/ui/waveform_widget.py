@@ -1,19 +1,65 @@
 """Waveform visualization widget."""
 
-import matplotlib
+import math
+from typing import List, Optional
 
-matplotlib.use("Qt5Agg")  # Ensure Qt backend is used
+import numpy as np
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, Signal, QTimer, QPointF, QRect
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPixmap, QPolygonF
 
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from PySide6.QtCore import Signal, QTimer
-from typing import Optional
-
-from ..core.config import UIColors
+from ..core.config import AppConfig, UIColors
 from ..audio.processor import AudioData, AudioProcessor
 
+# Height of the time axis drawn above the plot: axis title plus tick labels
+_AXIS_HEIGHT = 36
+_BOTTOM_MARGIN = 4
+_TICK_LENGTH = 4
+# Minimum horizontal distance between time ticks, in pixels
+_MIN_TICK_SPACING = 70
+# Half the width of the strip repainted around a moving indicator line
+_LINE_STRIP_HALF_WIDTH = 2
+# Amplitude range shown on the vertical axis, with headroom above full scale
+_Y_LIMIT = 1.1
+# Amplitudes that get a horizontal grid line
+_GRID_AMPLITUDES = (-1.0, -0.5, 0.0, 0.5, 1.0)
+
+_EMPTY_MESSAGE = "No audio loaded\nDrag and drop audio files or select from library"
+
+
+def _with_alpha(color_name: str, alpha: float) -> QColor:
+    """Get a QColor with the given opacity."""
+    color = QColor(color_name)
+    color.setAlphaF(alpha)
+    return color
+
+
+# Message colors for the empty, loading (slightly dimmed) and error states
+_TEXT_COLOR = QColor(UIColors.TEXT_PRIMARY)
+_LOADING_TEXT_COLOR = _with_alpha(UIColors.TEXT_PRIMARY, 0.8)
+_ERROR_TEXT_COLOR = QColor(UIColors.TEXT_ERROR)
+
+
+def _tick_step(span: float, max_ticks: int) -> float:
+    """
+    Pick a 1/2/5 x 10^n tick step that fits at most max_ticks ticks in a span.
+
+    Args:
+        span: Length of the axis in data units; must be positive
+        max_ticks: Largest number of ticks that fits
+
+    Returns:
+        Distance between ticks in data units
+    """
+    raw_step = span / max(max_ticks, 1)
+    magnitude = 10.0 ** math.floor(math.log10(raw_step))
+    for factor in (1.0, 2.0, 5.0):
+        if raw_step <= factor * magnitude:
+            return factor * magnitude
+    return 10.0 * magnitude
+
 
-class WaveformWidget(FigureCanvas):
+class WaveformWidget(QWidget):
     """Custom widget for displaying audio waveforms with interactive controls."""
 
     # Signals
@@ -21,24 +67,41 @@ class WaveformWidget(FigureCanvas):
 
     def __init__(self, parent=None):
         """Initialize the waveform widget."""
-        # Create figure with dark background and minimal margins for better alignment
-        self.figure = Figure(
-            figsize=(12, 4),
-            facecolor=UIColors.BACKGROUND,
-            tight_layout={"pad": 0.3, "w_pad": 0.0, "h_pad": 0.0},
-        )
-        super().__init__(self.figure)
-        self.setParent(parent)
-
-        # Setup plot axes
-        self.axes = self.figure.add_subplot(111, facecolor=UIColors.BACKGROUND)
-        self._setup_axes_style()
+        super().__init__(parent)
+        self.setMinimumWidth(200)
+        # paintEvent fills the whole widget, so Qt can skip erasing it first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
 
         # Audio data
         self._audio_data: Optional[AudioData] = None
-        self._position_line = None
+        self.duration: float = 0.0  # Duration of loaded audio in seconds
+        # Whether a waveform is shown, and its reciprocal duration; the
+        # position hot path tests these instead of walking the audio data
+        self._ready = False
+        self._inv_duration = 0.0
+        self._time_axis: Optional[np.ndarray] = None
+        self._amplitude_data: Optional[np.ndarray] = None
+        self._prepared_columns = 0  # Plot width in device pixels the arrays match
         self._current_position = 0.0
-        self._drag_position_line = None  # Line showing drag position
+        self._position_pixel = -1  # Widget column the position line was drawn at
+        self._drag_position: Optional[float] = None  # Shown while dragging labels
+
+        # Background, axes and waveform, rendered on demand after loads and
+        # resizes; position and drag repaints only draw their lines on top
+        self._waveform_pixmap: Optional[QPixmap] = None
+        self._rerender_timer = QTimer(self)
+        self._rerender_timer.setSingleShot(True)
+        self._rerender_timer.setInterval(AppConfig.WAVEFORM_RESIZE_DEBOUNCE_MS)
+        self._rerender_timer.timeout.connect(self._rerender_waveform)
+
+        # Message shown instead of the waveform (empty, loading or error state)
+        self._message = _EMPTY_MESSAGE
+        self._message_color = _TEXT_COLOR
+        self._status_font = QFont()
+        self._status_font.setPointSize(14)
+        self._error_font = QFont()
+        self._error_font.setPointSize(12)
+        self._message_font = self._status_font
 
         # Loading animation
         self._loading_timer = QTimer()
@@ -46,33 +109,22 @@ class WaveformWidget(FigureCanvas):
         self._loading_dots = 0
         self._loading_file_name = ""
 
-        # Setup event handling
-        self.mpl_connect("button_press_event", self._on_click)
-
-        # Show initial empty state
-        self._show_empty_state()
-
-    def _setup_axes_style(self) -> None:
-        """Setup the visual style of the axes."""
-        self.axes.tick_params(colors=UIColors.TEXT_PRIMARY)
-        for spine in self.axes.spines.values():
-            spine.set_color(UIColors.TEXT_PRIMARY)
-
-    def _show_empty_state(self) -> None:
-        """Display empty state message."""
-        self.axes.clear()
-        self.axes.text(
-            0.5,
-            0.5,
-            "No audio loaded\nDrag and drop audio files or select from library",
-            horizontalalignment="center",
-            verticalalignment="center",
-            transform=self.axes.transAxes,
-            color=UIColors.TEXT_PRIMARY,
-            fontsize=14,
-        )
-        self._apply_axes_style()
-        self.draw()
+        # Plot area; the margins match the label bar below so times line up
+        self._left_margin = AppConfig.PLOT_LEFT_MARGIN
+        self._right_margin = AppConfig.PLOT_RIGHT_MARGIN
+        self._usable_width = self.width() - self._left_margin - self._right_margin
+
+        # Painting resources, created once rather than on every paint
+        self._background_color = QColor(UIColors.BACKGROUND)
+        self._frame_pen = QPen(_TEXT_COLOR, 1)
+        self._grid_pen = QPen(_with_alpha(UIColors.GRID_COLOR, 0.2), 1)
+        self._waveform_pen = QPen(_with_alpha(UIColors.WAVEFORM_COLOR, 0.8), 0.8)
+        self._position_pen = QPen(_with_alpha(UIColors.POSITION_LINE_COLOR, 0.9), 2)
+        self._drag_pen = QPen(_with_alpha("#888888", 0.7), 1, Qt.PenStyle.DashLine)
+        self._tick_font = QFont()
+        self._tick_font.setPointSize(9)
+        self._title_font = QFont()
+        self._title_font.setPointSize(10)
 
     def show_loading_state(self, file_name: str = "") -> None:
         """Display loading state message with animation."""
@@ -87,27 +139,13 @@ class WaveformWidget(FigureCanvas):
 
     def _update_loading_animation(self) -> None:
         """Update the loading animation."""
-        self.axes.clear()
-
         # Create animated dots
         dots = "." * (self._loading_dots % 4)
         loading_text = f"Loading audio waveform{dots}"
         if self._loading_file_name:
             loading_text += f"\n{self._loading_file_name}"
 
-        self.axes.text(
-            0.5,
-            0.5,
-            loading_text,
-            horizontalalignment="center",
-            verticalalignment="center",
-            transform=self.axes.transAxes,
-            color=UIColors.TEXT_PRIMARY,
-            fontsize=14,
-            alpha=0.8,  # Slightly dimmed to indicate processing
-        )
-        self._apply_axes_style()
-        self.draw()
+        self._show_message(loading_text, _LOADING_TEXT_COLOR, self._status_font)
 
         self._loading_dots += 1
 
@@ -119,28 +157,23 @@ class WaveformWidget(FigureCanvas):
 
     def _show_error_state(self, error_message: str) -> None:
         """Display error state message."""
-        self.axes.clear()
-        self.axes.text(
-            0.5,
-            0.5,
+        self._show_message(
             f"Error loading audio:\n{error_message}",
-            horizontalalignment="center",
-            verticalalignment="center",
-            transform=self.axes.transAxes,
-            color=UIColors.TEXT_ERROR,
-            fontsize=12,
+            _ERROR_TEXT_COLOR,
+            self._error_font,
         )
-        self._apply_axes_style()
-        self.draw()
-
-    def _apply_axes_style(self) -> None:
-        """Apply consistent styling to axes."""
-        self.axes.set_xlim(0, 1)
-        self.axes.set_ylim(0, 1)
-        self.axes.set_facecolor(UIColors.BACKGROUND)
-        self.axes.tick_params(colors=UIColors.TEXT_PRIMARY)
-        for spine in self.axes.spines.values():
-            spine.set_color(UIColors.TEXT_PRIMARY)
+
+    def _show_message(self, message: str, color: QColor, font: QFont) -> None:
+        """Show a message in place of the waveform."""
+        self._ready = False
+        self._audio_data = None
+        self._time_axis = None
+        self._amplitude_data = None
+        self._waveform_pixmap = None
+        self._message = message
+        self._message_color = color
+        self._message_font = font
+        self.update()
 
     def load_audio_data(self, audio_data: AudioData) -> bool:
         """
@@ -159,59 +192,28 @@ class WaveformWidget(FigureCanvas):
             if not audio_data.loaded:
                 raise ValueError("Audio data not loaded")
 
-            self._audio_data = audio_data
-
-            # Prepare waveform for display
+            # Prepare one min/max pair per device pixel column of the plot
+            columns = self._pixel_columns()
             time_axis, amplitude_data = AudioProcessor.prepare_waveform_for_display(
-                audio_data
-            )
-
-            # Clear and plot waveform
-            self.axes.clear()
-            self.axes.plot(
-                time_axis,
-                amplitude_data,
-                color=UIColors.WAVEFORM_COLOR,
-                linewidth=0.8,
-                alpha=0.8,
+                audio_data, columns
             )
 
-            # Setup axes
-            self.axes.set_xlim(0, audio_data.duration)
-            self.axes.set_ylim(-1.1, 1.1)
-            # Move x-axis label to the top to reduce separation with label bar
-            self.axes.xaxis.set_label_position("top")
-            self.axes.set_xlabel(
-                "Time (seconds)", color=UIColors.TEXT_PRIMARY, fontsize=10
-            )
-            # Remove y-axis label to maximize plot width for alignment with label bar
-            self.axes.set_ylabel("")
-            self.axes.grid(True, alpha=0.2, color=UIColors.GRID_COLOR, linewidth=0.5)
-
-            # Apply styling
-            self.axes.set_facecolor(UIColors.BACKGROUND)
-            self.axes.tick_params(colors=UIColors.TEXT_PRIMARY, labelsize=9)
-            # Remove y-axis ticks to save space and move x-axis ticks to top
-            self.axes.tick_params(
-                left=False,
-                labelleft=False,
-                top=True,
-                labeltop=True,
-                bottom=False,
-                labelbottom=False,
-            )
-            for spine in self.axes.spines.values():
-                spine.set_color(UIColors.TEXT_PRIMARY)
-
-            # Add position indicator
-            self._position_line = self.axes.axvline(
-                x=0, color=UIColors.POSITION_LINE_COLOR, linewidth=2, alpha=0.9
-            )
-
-            # Force redraw
-            self.figure.tight_layout()
-            self.draw()
-
+            self._audio_data = audio_data
+            self.duration = audio_data.duration
+            self._inv_duration = 1.0 / self.duration if self.duration > 0 else 0.0
+            self._ready = self.duration > 0
+            self._time_axis = time_axis
+            self._amplitude_data = amplitude_data
+            self._prepared_columns = columns
+            self._waveform_pixmap = None
+            self._message = ""
+
+            # Reset the position indicators
+            self._current_position = 0.0
+            self._position_pixel = self._time_to_x(0.0)
+            self._drag_position = None
+
+            self.update()
             return True
 
         except Exception as e:
@@ -226,53 +228,197 @@ class WaveformWidget(FigureCanvas):
         Args:
             position_seconds: Current position in seconds
         """
-        if (
-            self._position_line is not None
-            and self._audio_data is not None
-            and self._audio_data.duration > 0
-        ):
-            self._current_position = position_seconds
-            self._position_line.set_xdata([position_seconds])
-            self.draw_idle()
+        if not self._ready:
+            return
+        self._current_position = position_seconds
+
+        # Redraw only once the line would land on another pixel column
+        pixel = self._left_margin + int(
+            position_seconds * self._inv_duration * self._usable_width
+        )
+        if pixel == self._position_pixel:
+            return
+        self._update_line(self._position_pixel)
+        self._update_line(pixel)
+        self._position_pixel = pixel
 
     def clear(self) -> None:
         """Clear the waveform and show empty state."""
-        self._audio_data = None
-        self._position_line = None
+        self.duration = 0.0
         self._current_position = 0.0
-        self._drag_position_line = None
-        self._show_empty_state()
+        self._position_pixel = -1
+        self._drag_position = None
+        self._show_message(_EMPTY_MESSAGE, _TEXT_COLOR, self._status_font)
+
+    def resizeEvent(self, event) -> None:
+        """Handle widget resize."""
+        super().resizeEvent(event)
+        self._usable_width = self.width() - self._left_margin - self._right_margin
+        # Stretch the current pixmap while the size keeps changing, and render
+        # it again once resizing pauses
+        self._rerender_timer.start()
+        # The resize repaints everything, with the line at its new column
+        self._position_pixel = self._time_to_x(self._current_position)
+
+    def _rerender_waveform(self) -> None:
+        """Render the waveform again at the settled size."""
+        self._waveform_pixmap = None
+        self.update()
+
+    def _pixel_columns(self) -> int:
+        """Get the plot width in device pixels."""
+        return max(int(self._usable_width * self.devicePixelRatioF()), 1)
+
+    def _plot_rect(self) -> QRect:
+        """Get the rectangle the waveform is plotted in."""
+        return QRect(
+            self._left_margin,
+            _AXIS_HEIGHT,
+            max(self._usable_width, 1),
+            max(self.height() - _AXIS_HEIGHT - _BOTTOM_MARGIN, 1),
+        )
 
-    def _on_click(self, event) -> None:
-        """
-        Handle mouse clicks on the waveform.
+    def _time_to_x(self, time_seconds: float) -> int:
+        """Convert a time to a widget x coordinate, as the label bar does."""
+        return self._left_margin + int(
+            time_seconds * self._inv_duration * self._usable_width
+        )
 
-        Args:
-            event: Matplotlib mouse event
-        """
-        if (
-            event.inaxes == self.axes
-            and self._audio_data is not None
-            and self._audio_data.duration > 0
-        ):
-            clicked_time = event.xdata
-            if clicked_time is not None:
-                # Clamp to valid range
-                clicked_time = max(0, min(clicked_time, self._audio_data.duration))
-                self.position_changed.emit(clicked_time)
+    def _amplitude_to_y(self, amplitude: float, plot_rect: QRect) -> float:
+        """Convert an amplitude to a widget y coordinate."""
+        center_y = plot_rect.top() + plot_rect.height() / 2
+        return center_y - amplitude * plot_rect.height() / (2 * _Y_LIMIT)
+
+    def _build_waveform_polygon(self, plot_rect: QRect) -> QPolygonF:
+        """Map the display arrays to a polygon in widget coordinates."""
+        # Re-downsample after a resize so there is still one bin per column
+        columns = self._pixel_columns()
+        if columns != self._prepared_columns:
+            self._time_axis, self._amplitude_data = (
+                AudioProcessor.prepare_waveform_for_display(self._audio_data, columns)
+            )
+            self._prepared_columns = columns
+
+        xs = self._left_margin + self._time_axis * (
+            self._usable_width / self.duration
+        )
+        center_y = plot_rect.top() + plot_rect.height() / 2
+        ys = center_y - self._amplitude_data * (plot_rect.height() / (2 * _Y_LIMIT))
+        return QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist())])
+
+    def paintEvent(self, event) -> None:
+        """Paint the waveform, its time axis and the position indicators."""
+        painter = QPainter(self)
+        plot_rect = self._plot_rect()
+
+        if not self._ready:
+            # Empty, loading or error state
+            painter.fillRect(self.rect(), self._background_color)
+            painter.setPen(self._frame_pen)
+            painter.drawRect(plot_rect)
+            painter.setPen(self._message_color)
+            painter.setFont(self._message_font)
+            painter.drawText(plot_rect, Qt.AlignmentFlag.AlignCenter, self._message)
+            return
+
+        if self._waveform_pixmap is None:
+            self._waveform_pixmap = self._render_waveform(plot_rect)
+        if self._rerender_timer.isActive():
+            painter.drawPixmap(self.rect(), self._waveform_pixmap)
+        else:
+            painter.drawPixmap(0, 0, self._waveform_pixmap)
+
+        # Drag position indicator
+        if self._drag_position is not None:
+            x = self._time_to_x(self._drag_position)
+            painter.setPen(self._drag_pen)
+            painter.drawLine(x, plot_rect.top(), x, plot_rect.bottom())
+
+        # Playback position indicator
+        x = self._time_to_x(self._current_position)
+        painter.setPen(self._position_pen)
+        painter.drawLine(x, plot_rect.top(), x, plot_rect.bottom())
+
+    def _render_waveform(self, plot_rect: QRect) -> QPixmap:
+        """Render the background, the axes and the waveform to a pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(self._background_color)
+
+        painter = QPainter(pixmap)
+        self._draw_axes(painter, plot_rect)
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setClipRect(plot_rect)
+        painter.setPen(self._waveform_pen)
+        painter.drawPolyline(self._build_waveform_polygon(plot_rect))
+
+        painter.end()
+        return pixmap
+
+    def _draw_axes(self, painter: QPainter, plot_rect: QRect) -> None:
+        """Draw the grid, the plot frame and the time axis above the plot."""
+        left = plot_rect.left()
+        right = plot_rect.right()
+        top = plot_rect.top()
+        bottom = plot_rect.bottom()
+
+        # Time ticks at round intervals
+        step = _tick_step(
+            self.duration, max(plot_rect.width() // _MIN_TICK_SPACING, 1)
+        )
+        tick_times: List[float] = [
+            i * step for i in range(int(self.duration / step + 1e-9) + 1)
+        ]
+        tick_xs = [self._time_to_x(t) for t in tick_times]
+
+        # Grid
+        painter.setPen(self._grid_pen)
+        for x in tick_xs:
+            painter.drawLine(x, top, x, bottom)
+        for amplitude in _GRID_AMPLITUDES:
+            y = int(self._amplitude_to_y(amplitude, plot_rect))
+            painter.drawLine(left, y, right, y)
+
+        # Frame and ticks
+        painter.setPen(self._frame_pen)
+        painter.drawRect(plot_rect)
+        for x in tick_xs:
+            painter.drawLine(x, top - _TICK_LENGTH, x, top)
+
+        # Tick labels just above the ticks, axis title above them
+        painter.setFont(self._tick_font)
+        metrics = painter.fontMetrics()
+        label_bottom = top - _TICK_LENGTH - 1
+        baseline = label_bottom - metrics.descent()
+        for t, x in zip(tick_times, tick_xs):
+            text = f"{round(t, 6):g}"
+            painter.drawText(x - metrics.horizontalAdvance(text) // 2, baseline, text)
+
+        painter.setFont(self._title_font)
+        title_rect = QRect(left, 0, plot_rect.width(), label_bottom - metrics.height())
+        painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, "Time (seconds)")
+
+    def mousePressEvent(self, event) -> None:
+        """Seek to the clicked time."""
+        if not self._ready:
+            return
+
+        pos = event.position()
+        if not self._plot_rect().contains(pos.toPoint()):
+            return
+
+        # Clamp to valid range
+        ratio = (pos.x() - self._left_margin) / max(self._usable_width, 1)
+        clicked_time = max(0.0, min(ratio * self.duration, self.duration))
+        self.position_changed.emit(clicked_time)
 
     @property
     def has_audio(self) -> bool:
         """Check if audio data is loaded."""
         return self._audio_data is not None and self._audio_data.loaded
 
-    @property
-    def duration(self) -> float:
-        """Get the duration of loaded audio."""
-        if self._audio_data:
-            return self._audio_data.duration
-        return 0.0
-
     @property
     def current_position(self) -> float:
         """Get the current position in seconds."""
@@ -285,28 +431,28 @@ class WaveformWidget(FigureCanvas):
         Args:
             position_seconds: Position in seconds to show the drag line
         """
-        if (
-            self._audio_data is not None
-            and self._audio_data.loaded
-            and self._audio_data.duration > 0
-        ):
-            # Remove existing drag line if any
-            if self._drag_position_line is not None:
-                self._drag_position_line.remove()
-
-            # Add new drag position line (fine gray line)
-            self._drag_position_line = self.axes.axvline(
-                x=position_seconds,
-                color="#888888",  # Gray color
-                linewidth=1,
-                alpha=0.7,
-                linestyle="--",  # Dashed line to distinguish from position line
-            )
-            self.draw_idle()
+        if not self._ready:
+            return
+
+        # Repaint only the columns under the old and the new line
+        x = self._time_to_x(position_seconds)
+        if self._drag_position is not None:
+            old_x = self._time_to_x(self._drag_position)
+            if old_x == x:
+                self._drag_position = position_seconds
+                return
+            self._update_line(old_x)
+        self._drag_position = position_seconds
+        self._update_line(x)
 
     def hide_drag_position(self) -> None:
         """Hide the drag position indicator."""
-        if self._drag_position_line is not None:
-            self._drag_position_line.remove()
-            self._drag_position_line = None
-            self.draw_idle()
+        if self._drag_position is not None:
+            x = self._time_to_x(self._drag_position)
+            self._drag_position = None
+            self._update_line(x)
+
+    def _update_line(self, x: int) -> None:
+        """Schedule a repaint of the strip a vertical indicator line at x covers."""
+        left = x - _LINE_STRIP_HALF_WIDTH
+        self.update(left, 0, 2 * _LINE_STRIP_HALF_WIDTH + 1, self.height())